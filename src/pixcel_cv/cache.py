@@ -0,0 +1,72 @@
+"""Location of the on-disk cache shared by the generator and loaders."""
+
+import os
+from pathlib import Path
+
+
+def cache_dir(*parts: str) -> Path:
+    """Return a cache subdirectory, creating it if necessary.
+
+    The cache root is ``$PIXCEL_CV_CACHE_DIR`` when set, otherwise
+    ``pixcel_cv`` below ``$XDG_CACHE_HOME`` (default ``~/.cache``).
+
+    Args:
+        parts: Path components below the cache root.
+
+    Returns:
+        Path to the existing cache directory.
+
+    Raises:
+        OSError: If the directory cannot be created.
+    """
+    root = os.environ.get("PIXCEL_CV_CACHE_DIR")
+    if root:
+        base = Path(root)
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = (Path(xdg_cache) if xdg_cache else Path.home() / ".cache") / "pixcel_cv"
+
+    path = base.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def private_cache_dir(*parts: str) -> Path | None:
+    """Return a cache subdirectory that only the current user can write to.
+
+    Caches that hold executable data (pickles, bytecode, TeX formats) must
+    not be shared with other users. A directory created under a permissive
+    umask is restricted to its owner; one owned by another user is refused.
+
+    Args:
+        parts: Path components below the cache root.
+
+    Returns:
+        Path to the cache directory, or None if it cannot be created or is
+        not owned by the current user.
+    """
+    try:
+        path = cache_dir(*parts)
+        dir_stat = os.stat(path)
+        if not is_private(dir_stat):
+            if dir_stat.st_uid != os.getuid():
+                return None
+            os.chmod(path, dir_stat.st_mode & 0o7700)
+    except OSError:
+        return None
+    return path
+
+
+def is_private(file_stat: os.stat_result) -> bool:
+    """Check that only the current user can have written a file or directory.
+
+    Args:
+        file_stat: Stat result of the file or directory.
+
+    Returns:
+        True if it is owned by the current user and not writable by group or
+        others. Always True where POSIX ownership is unavailable (Windows).
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & 0o022
@@ -1,15 +1,40 @@
 """CLI for CV generation."""
 
+import argparse
+import functools
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, NamedTuple, Protocol
 
-from .generator import CVGenerator, AnschreibenGenerator
-from .loaders import (
-    load_cv_from_yaml,
-    load_cv_from_yaml_folder,
-    load_anschreiben_from_yaml,
-    load_anschreiben_from_yaml_folder,
-)
+# The generator and loader modules pull in Jinja2, PyYAML and Pydantic; they are
+# imported inside main() so --help and usage errors return without loading them.
+
+# Subcommands that switch the CLI from flag mode to subcommand mode
+_SUBCOMMANDS = frozenset(("cv", "anschreiben"))
+
+
+class _DocumentGenerator(Protocol):
+    """Output interface shared by CVGenerator and AnschreibenGenerator."""
+
+    def to_latex(self) -> str: ...
+
+    def to_pdf(
+        self,
+        output_path: Path,
+        engine: str = ...,
+        precompile_preamble: bool = ...,
+        force: bool = ...,
+    ) -> None: ...
+
+
+class _Mode[D](NamedTuple):
+    """Label, loaders and generator for one document type."""
+
+    label: str
+    load_file: Callable[[Path], D]
+    load_folder: Callable[[Path], D]
+    make_generator: Callable[[D], _DocumentGenerator]
 
 
 def main(
@@ -21,6 +46,10 @@ def main(
     engine: str = "pdflatex",
     portrait: str | None = None,
     is_anschreiben: bool = False,
+    precompile_preamble: bool = False,
+    batch_folder: str | None = None,
+    output_dir: str = "output",
+    force: bool = False,
 ) -> int:
     """Generate CV or Anschreiben from YAML file or folder.
 
@@ -33,11 +62,32 @@ def main(
         engine: LaTeX engine to use.
         portrait: Path to portrait picture file (optional, CV only).
         is_anschreiben: If True, generate Anschreiben instead of CV.
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        batch_folder: Folder with one CV YAML file per CV to compile in parallel (optional).
+        output_dir: Output folder for PDFs in batch mode.
+        force: If True, recompile PDFs even if they are up to date.
 
     Returns:
         Exit code (0 for success, 1 for error).
     """
     try:
+        if batch_folder:
+            if input_yaml or yaml_folder:
+                print(
+                    "Error: Cannot combine --batch with an input file or --yaml-folder",
+                    file=sys.stderr,
+                )
+                return 1
+            if output_pdf or output_latex or portrait:
+                print(
+                    "Error: Cannot combine --batch with --pdf, --latex or --portrait",
+                    file=sys.stderr,
+                )
+                return 1
+            return _generate_batch(
+                Path(batch_folder), Path(output_dir), engine, precompile_preamble, force
+            )
+
         if input_yaml and yaml_folder:
             print("Error: Cannot specify both input file and --yaml-folder", file=sys.stderr)
             return 1
@@ -46,89 +96,77 @@ def main(
             print("Error: Must specify either input YAML file or --yaml-folder", file=sys.stderr)
             return 1
 
-        if is_anschreiben:
-            # Anschreiben mode
-            if yaml_folder:
-                folder_path = Path(yaml_folder)
-                if not folder_path.exists():
-                    print(f"Error: Folder not found: {yaml_folder}", file=sys.stderr)
-                    return 1
-                print(f"Loading Anschreiben from folder {yaml_folder}...")
-                anschreiben = load_anschreiben_from_yaml_folder(folder_path)
-            else:
-                input_path = Path(input_yaml)
-                if not input_path.exists():
-                    print(f"Error: Input file not found: {input_yaml}", file=sys.stderr)
-                    return 1
-                print(f"Loading Anschreiben from {input_yaml}...")
-                anschreiben = load_anschreiben_from_yaml(input_path)
-
-            generator = AnschreibenGenerator(anschreiben)
-
-            if output_latex:
-                latex_path = Path(output_latex)
-                latex_path.parent.mkdir(parents=True, exist_ok=True)
-                latex_content = generator.to_latex()
-                latex_path.write_text(latex_content, encoding="utf-8")
-                print(f"LaTeX exported to {output_latex}")
-
-            if output_pdf:
-                pdf_path = Path(output_pdf)
-                print(f"Generating PDF using {engine}...")
-                generator.to_pdf(pdf_path, engine=engine)
-                print(f"PDF generated successfully: {output_pdf}")
-
-            if not output_pdf and not output_latex:
-                print("No output specified. Use --pdf or --latex to save output.")
-                return 1
+        from .generator import AnschreibenGenerator, CVGenerator
+        from .loaders import (
+            load_anschreiben_from_yaml,
+            load_anschreiben_from_yaml_folder,
+            load_cv_from_yaml,
+            load_cv_from_yaml_folder,
+        )
+        from .models import Anschreiben, CurriculumVitae
 
-            return 0
+        # Config folder and portrait only apply to the CV
+        config_path = Path(config_folder) if config_folder and not is_anschreiben else None
+        modes: dict[str, _Mode[Any]] = {
+            "cv": _Mode[CurriculumVitae](
+                "CV",
+                load_cv_from_yaml,
+                functools.partial(
+                    load_cv_from_yaml_folder, config_folder=config_path, portrait_path=portrait
+                ),
+                CVGenerator,
+            ),
+            "anschreiben": _Mode[Anschreiben](
+                "Anschreiben",
+                load_anschreiben_from_yaml,
+                load_anschreiben_from_yaml_folder,
+                AnschreibenGenerator,
+            ),
+        }
+        mode = modes["anschreiben" if is_anschreiben else "cv"]
 
-        else:
-            # CV mode
-            if yaml_folder:
-                folder_path = Path(yaml_folder)
-                if not folder_path.exists():
-                    print(f"Error: Folder not found: {yaml_folder}", file=sys.stderr)
-                    return 1
-                print(f"Loading CV from folder {yaml_folder}...")
-                if config_folder:
-                    config_path = Path(config_folder)
-                    if not config_path.exists():
-                        print(f"Error: Config folder not found: {config_folder}", file=sys.stderr)
-                        return 1
-                    print(f"Loading config from {config_folder}...")
-                    cv = load_cv_from_yaml_folder(folder_path, config_folder=config_path, portrait_path=portrait)
-                else:
-                    cv = load_cv_from_yaml_folder(folder_path, portrait_path=portrait)
-            else:
-                input_path = Path(input_yaml)
-                if not input_path.exists():
-                    print(f"Error: Input file not found: {input_yaml}", file=sys.stderr)
+        if yaml_folder:
+            folder_path = Path(yaml_folder)
+            if not folder_path.exists():
+                print(f"Error: Folder not found: {yaml_folder}", file=sys.stderr)
+                return 1
+            print(f"Loading {mode.label} from folder {yaml_folder}...")
+            if config_path is not None:
+                if not config_path.exists():
+                    print(f"Error: Config folder not found: {config_folder}", file=sys.stderr)
                     return 1
-                print(f"Loading CV from {input_yaml}...")
-                cv = load_cv_from_yaml(input_path)
-
-            generator = CVGenerator(cv)
-
-            if output_latex:
-                latex_path = Path(output_latex)
-                latex_path.parent.mkdir(parents=True, exist_ok=True)
-                latex_content = generator.to_latex()
-                latex_path.write_text(latex_content, encoding="utf-8")
-                print(f"LaTeX exported to {output_latex}")
-
-            if output_pdf:
-                pdf_path = Path(output_pdf)
-                print(f"Generating PDF using {engine}...")
-                generator.to_pdf(pdf_path, engine=engine)
-                print(f"PDF generated successfully: {output_pdf}")
-
-            if not output_pdf and not output_latex:
-                print("No output specified. Use --pdf or --latex to save output.")
+                print(f"Loading config from {config_folder}...")
+            document = mode.load_folder(folder_path)
+        else:
+            print(f"Loading {mode.label} from {input_yaml}...")
+            try:
+                document = mode.load_file(Path(input_yaml))
+            except FileNotFoundError:
+                print(f"Error: Input file not found: {input_yaml}", file=sys.stderr)
                 return 1
 
-            return 0
+        generator = mode.make_generator(document)
+
+        if output_latex:
+            latex_path = Path(output_latex)
+            latex_path.parent.mkdir(parents=True, exist_ok=True)
+            latex_content = generator.to_latex()
+            latex_path.write_bytes(latex_content.encode("utf-8"))
+            print(f"LaTeX exported to {output_latex}")
+
+        if output_pdf:
+            pdf_path = Path(output_pdf)
+            print(f"Generating PDF using {engine}...")
+            generator.to_pdf(
+                pdf_path, engine=engine, precompile_preamble=precompile_preamble, force=force
+            )
+            print(f"PDF generated successfully: {output_pdf}")
+
+        if not output_pdf and not output_latex:
+            print("No output specified. Use --pdf or --latex to save output.")
+            return 1
+
+        return 0
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -138,57 +176,165 @@ def main(
         return 1
 
 
-if __name__ == "__main__":
-    import argparse
+def _generate_batch(
+    batch_folder: Path, output_dir: Path, engine: str, precompile_preamble: bool, force: bool
+) -> int:
+    """Compile every CV YAML file in a folder to a PDF of the same name.
+
+    Args:
+        batch_folder: Folder with one CV YAML file per CV.
+        output_dir: Folder where the PDFs are written.
+        engine: LaTeX engine to use.
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        force: If True, recompile PDFs even if they are up to date.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    if not batch_folder.is_dir():
+        print(f"Error: Folder not found: {batch_folder}", file=sys.stderr)
+        return 1
+
+    from .generator import compile_many_to_pdf
+    from .loaders import load_cv_from_yaml
+
+    inputs = sorted(batch_folder.glob("*.yaml"))
+    if not inputs:
+        print(f"Error: No YAML files found in {batch_folder}", file=sys.stderr)
+        return 1
+
+    print(f"Loading {len(inputs)} CVs from {batch_folder}...")
+    cvs = {path.stem: load_cv_from_yaml(path) for path in inputs}
 
+    print(f"Generating {len(cvs)} PDFs using {engine}...")
+    outputs = compile_many_to_pdf(
+        cvs, output_dir, engine=engine, precompile_preamble=precompile_preamble, force=force
+    )
+    for pdf_path in outputs.values():
+        print(f"PDF generated successfully: {pdf_path}")
+    return 0
+
+
+@functools.lru_cache(maxsize=1)
+def _build_subcommand_parser() -> argparse.ArgumentParser:
+    """Build the parser for the ``cv`` / ``anschreiben`` subcommand syntax.
+
+    The parser is built once per process and reused by later calls.
+
+    Returns:
+        Argument parser with one subparser per document type.
+    """
+    parser = argparse.ArgumentParser(description="Generate pixel-perfect CVs or Anschreiben from YAML")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+
+    # CV subcommand
+    cv_parser = subparsers.add_parser("cv", help="Generate CV (default)")
+    cv_parser.add_argument("input", nargs="?", help="Input YAML file")
+    cv_parser.add_argument("--yaml-folder", help="Folder with YAML data files")
+    cv_parser.add_argument(
+        "--config-folder", help="Folder with cv_config.yaml (defaults to yaml-folder)"
+    )
+    cv_parser.add_argument("--pdf", help="Output PDF file path")
+    cv_parser.add_argument("--latex", help="Output LaTeX file path")
+    cv_parser.add_argument(
+        "--engine",
+        choices=["pdflatex", "xelatex", "lualatex"],
+        default="pdflatex",
+        help="LaTeX engine to use",
+    )
+    cv_parser.add_argument("--portrait", help="Path to portrait picture file")
+    cv_parser.add_argument("--batch", help="Folder with one CV YAML file per CV to compile")
+    cv_parser.add_argument(
+        "--output-dir", default="output", help="Output folder for PDFs in batch mode"
+    )
+    cv_parser.add_argument(
+        "--cache-preamble",
+        action="store_true",
+        help="Reuse a precompiled preamble format between runs (pdflatex only)",
+    )
+    cv_parser.add_argument(
+        "--force", action="store_true", help="Recompile the PDF even if it is up to date"
+    )
+
+    # Anschreiben subcommand
+    anschreiben_parser = subparsers.add_parser("anschreiben", help="Generate Anschreiben (cover letter)")
+    anschreiben_parser.add_argument("input", nargs="?", help="Input YAML file")
+    anschreiben_parser.add_argument("--yaml-folder", help="Folder with YAML data files")
+    anschreiben_parser.add_argument("--pdf", help="Output PDF file path")
+    anschreiben_parser.add_argument("--latex", help="Output LaTeX file path")
+    anschreiben_parser.add_argument(
+        "--engine",
+        choices=["pdflatex", "xelatex", "lualatex"],
+        default="pdflatex",
+        help="LaTeX engine to use",
+    )
+    anschreiben_parser.add_argument(
+        "--cache-preamble",
+        action="store_true",
+        help="Reuse a precompiled preamble format between runs (pdflatex only)",
+    )
+    anschreiben_parser.add_argument(
+        "--force", action="store_true", help="Recompile the PDF even if it is up to date"
+    )
+
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _build_flat_parser() -> argparse.ArgumentParser:
+    """Build the parser for the flag-only syntax used by the Makefile.
+
+    The parser is built once per process and reused by later calls.
+
+    Returns:
+        Argument parser without subcommands.
+    """
     parser = argparse.ArgumentParser(
         description="Generate pixel-perfect CVs or Anschreiben from YAML",
         add_help=False  # We'll add help manually to allow flexible parsing
     )
-    
+    parser.add_argument("input", nargs="?", help="Input YAML file")
+    parser.add_argument("--yaml-folder", help="Folder with YAML data files")
+    parser.add_argument(
+        "--config-folder", help="Folder with cv_config.yaml (defaults to yaml-folder)"
+    )
+    parser.add_argument("--pdf", help="Output PDF file path")
+    parser.add_argument("--latex", help="Output LaTeX file path")
+    parser.add_argument(
+        "--engine",
+        choices=["pdflatex", "xelatex", "lualatex"],
+        default="pdflatex",
+        help="LaTeX engine to use",
+    )
+    parser.add_argument("--portrait", help="Path to portrait picture file")
+    parser.add_argument("--batch", help="Folder with one CV YAML file per CV to compile")
+    parser.add_argument(
+        "--output-dir", default="output", help="Output folder for PDFs in batch mode"
+    )
+    parser.add_argument(
+        "--cache-preamble",
+        action="store_true",
+        help="Reuse a precompiled preamble format between runs (pdflatex only)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Recompile the PDF even if it is up to date"
+    )
+    parser.add_argument("--template", help="Template to use (timeline, etc.)")
+    parser.add_argument("-h", "--help", action="help", help="show this help message and exit")
+
+    return parser
+
+
+if __name__ == "__main__":
     # Try to detect if a subcommand is being used
-    import sys
     args_list = sys.argv[1:]
     
     # Check if there's a recognized subcommand
-    has_subcommand = any(cmd in args_list for cmd in ['cv', 'anschreiben'])
+    has_subcommand = not _SUBCOMMANDS.isdisjoint(args_list)
     
     if has_subcommand:
         # Use subcommand mode
-        parser = argparse.ArgumentParser(description="Generate pixel-perfect CVs or Anschreiben from YAML")
-        subparsers = parser.add_subparsers(dest="command", help="Command to run")
-
-        # CV subcommand
-        cv_parser = subparsers.add_parser("cv", help="Generate CV (default)")
-        cv_parser.add_argument("input", nargs="?", help="Input YAML file")
-        cv_parser.add_argument("--yaml-folder", help="Folder with YAML data files")
-        cv_parser.add_argument(
-            "--config-folder", help="Folder with cv_config.yaml (defaults to yaml-folder)"
-        )
-        cv_parser.add_argument("--pdf", help="Output PDF file path")
-        cv_parser.add_argument("--latex", help="Output LaTeX file path")
-        cv_parser.add_argument(
-            "--engine",
-            choices=["pdflatex", "xelatex", "lualatex"],
-            default="pdflatex",
-            help="LaTeX engine to use",
-        )
-        cv_parser.add_argument("--portrait", help="Path to portrait picture file")
-
-        # Anschreiben subcommand
-        anschreiben_parser = subparsers.add_parser("anschreiben", help="Generate Anschreiben (cover letter)")
-        anschreiben_parser.add_argument("input", nargs="?", help="Input YAML file")
-        anschreiben_parser.add_argument("--yaml-folder", help="Folder with YAML data files")
-        anschreiben_parser.add_argument("--pdf", help="Output PDF file path")
-        anschreiben_parser.add_argument("--latex", help="Output LaTeX file path")
-        anschreiben_parser.add_argument(
-            "--engine",
-            choices=["pdflatex", "xelatex", "lualatex"],
-            default="pdflatex",
-            help="LaTeX engine to use",
-        )
-
-        args = parser.parse_args()
+        args = _build_subcommand_parser().parse_args()
 
         if args.command == "cv":
             sys.exit(
@@ -201,6 +347,10 @@ if __name__ == "__main__":
                     engine=args.engine,
                     portrait=args.portrait,
                     is_anschreiben=False,
+                    precompile_preamble=args.cache_preamble,
+                    force=args.force,
+                    batch_folder=args.batch,
+                    output_dir=args.output_dir,
                 )
             )
         elif args.command == "anschreiben":
@@ -214,31 +364,18 @@ if __name__ == "__main__":
                     engine=args.engine,
                     portrait=None,
                     is_anschreiben=True,
+                    precompile_preamble=args.cache_preamble,
+                    force=args.force,
                 )
             )
     else:
         # No subcommand: backward-compatible mode for Makefile
         # Auto-detect anschreiben if "anschreiben" is in the input filename
-        auto_anschreiben = any("anschreiben" in arg.lower() for arg in args_list if not arg.startswith("-"))
+        # Positional arguments are lower-cased in one go; NUL never occurs in argv
+        positional = "\0".join(arg for arg in args_list if not arg.startswith("-"))
+        auto_anschreiben = "anschreiben" in positional.lower()
         
-        parser.add_argument("input", nargs="?", help="Input YAML file")
-        parser.add_argument("--yaml-folder", help="Folder with YAML data files")
-        parser.add_argument(
-            "--config-folder", help="Folder with cv_config.yaml (defaults to yaml-folder)"
-        )
-        parser.add_argument("--pdf", help="Output PDF file path")
-        parser.add_argument("--latex", help="Output LaTeX file path")
-        parser.add_argument(
-            "--engine",
-            choices=["pdflatex", "xelatex", "lualatex"],
-            default="pdflatex",
-            help="LaTeX engine to use",
-        )
-        parser.add_argument("--portrait", help="Path to portrait picture file")
-        parser.add_argument("--template", help="Template to use (timeline, etc.)")
-        parser.add_argument("-h", "--help", action="help", help="show this help message and exit")
-
-        args = parser.parse_args()
+        args = _build_flat_parser().parse_args()
 
         # If auto-detected as anschreiben, use anschreiben mode
         if auto_anschreiben:
@@ -252,6 +389,8 @@ if __name__ == "__main__":
                     engine=args.engine,
                     portrait=None,
                     is_anschreiben=True,
+                    precompile_preamble=args.cache_preamble,
+                    force=args.force,
                 )
             )
         else:
@@ -266,5 +405,9 @@ if __name__ == "__main__":
                     engine=args.engine,
                     portrait=args.portrait,
                     is_anschreiben=False,
+                    precompile_preamble=args.cache_preamble,
+                    force=args.force,
+                    batch_folder=args.batch,
+                    output_dir=args.output_dir,
                 )
             )
@@ -1,10 +1,16 @@
 """CV generator that converts data models to LaTeX."""
 
+import errno
+import hashlib
+import os
 import shutil
 import subprocess
 import tempfile
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .cache import is_private, private_cache_dir
 from .models import CurriculumVitae, Anschreiben
 from .templates import load_german_cv_template, load_anschreiben_template
 
@@ -22,67 +28,465 @@ def render_cv(cv: CurriculumVitae) -> str:
     return template.render(cv=cv)
 
 
-def compile_to_pdf(cv: CurriculumVitae, output_path: Path, engine: str = "pdflatex") -> None:
-    """Render CV and compile to PDF.
+def _render_to(cv: CurriculumVitae, dest: Path) -> None:
+    """Render CV straight into a LaTeX file without building the whole string.
 
     Args:
-        cv: The CV model to compile.
-        output_path: Path where the PDF should be saved.
-        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        cv: The CV model to render.
+        dest: Path of the ``.tex`` file to write.
+    """
+    template = load_german_cv_template()
+    template.stream(cv=cv).dump(str(dest), encoding="utf-8", errors="strict")
 
-    Raises:
-        RuntimeError: If LaTeX compilation fails.
+
+# Log messages that signal the document needs another engine pass
+_RERUN_MARKERS = (b"Rerun to get", b"Rerun LaTeX")
+
+# Upper bound on engine passes per document
+_MAX_PASSES = 2
+
+# Number of log lines quoted when the engine reports nothing on stderr
+_LOG_TAIL_LINES = 20
+
+# Engines whose preamble can be dumped into a format file with mylatex.ltx.
+# XeTeX and LuaTeX cannot store the system fonts loaded through fontspec.
+_FORMAT_ENGINES = frozenset({"pdflatex"})
+
+
+def _needs_rerun(log_file: Path) -> bool:
+    """Check a LaTeX log for requests to run the engine again.
+
+    Args:
+        log_file: Path to the ``.log`` file written by the engine.
+
+    Returns:
+        True if another pass is required to resolve references.
+    """
+    try:
+        log = log_file.read_bytes()
+    except FileNotFoundError:
+        return True
+    return any(marker in log for marker in _RERUN_MARKERS)
+
+
+def _describe_failure(error: subprocess.CalledProcessError, log_file: Path) -> str:
+    """Extract a readable reason from a failed engine run.
+
+    LaTeX engines report errors on stdout and in the log file rather than on
+    stderr, so the tail of the log is used when stderr is empty.
+
+    Args:
+        error: The error raised by ``subprocess.run``.
+        log_file: Path to the ``.log`` file written by the engine.
+
+    Returns:
+        Error details, decoded only now that they are needed.
     """
-    latex_content = render_cv(cv)
+    stderr = (error.stderr or b"").decode("utf-8", errors="replace").strip()
+    if stderr:
+        return stderr
+    try:
+        lines = log_file.read_text(encoding="utf-8", errors="replace").splitlines()
+    except FileNotFoundError:
+        return ""
+    return "\n".join(lines[-_LOG_TAIL_LINES:])
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        tex_file = tmp_path / "cv.tex"
-        tex_file.write_text(latex_content, encoding="utf-8")
 
+def _engine_identity(engine: str) -> bytes:
+    """Identify the installed engine binary.
+
+    Format files only load in the engine build that dumped them, so this
+    changes whenever the TeX distribution is upgraded or replaced.
+
+    Args:
+        engine: LaTeX engine name.
+
+    Returns:
+        Resolved executable path with its modification time and size, or
+        the engine name if it is not on PATH.
+    """
+    executable = shutil.which(engine)
+    if executable is None:
+        return engine.encode()
+    resolved = os.path.realpath(executable)
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return resolved.encode()
+    return f"{resolved}\0{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+
+def _ensure_format(tex_file: Path, engine: str) -> tuple[str, Path] | None:
+    """Precompile the preamble of a LaTeX file into a cached format.
+
+    The format is built with ``mylatex.ltx`` and keyed by a hash of the
+    preamble and the engine binary, so documents sharing a preamble reuse
+    the same format and only their body is processed on each run, while a
+    TeX distribution upgrade builds a fresh one. A cached format is only
+    loaded from a directory and file that no other user can write to.
+
+    Args:
+        tex_file: Path to the ``.tex`` source.
+        engine: LaTeX engine to use.
+
+    Returns:
+        Tuple of format name and the directory containing it, or None if
+        the engine does not support dumped preambles, the cache is not
+        private to the current user or the build failed.
+    """
+    if engine not in _FORMAT_ENGINES:
+        return None
+
+    preamble, marker, _ = tex_file.read_bytes().partition(b"\\begin{document}")
+    if not marker:
+        return None
+
+    digest = hashlib.sha256(_engine_identity(engine) + b"\0" + preamble).hexdigest()[:16]
+    fmt_name = f"pixcel-{digest}"
+    fmt_dir = private_cache_dir("formats")
+    if fmt_dir is None:
+        return None
+
+    fmt_file = fmt_dir / f"{fmt_name}.fmt"
+    try:
+        if is_private(os.stat(fmt_file)):
+            return fmt_name, fmt_dir
+        return None
+    except FileNotFoundError:
+        pass
+
+    # Build in a private directory and move into place so concurrent runs
+    # never load a half-written format.
+    with tempfile.TemporaryDirectory(dir=fmt_dir) as build_dir:
         try:
-            # First compilation
             subprocess.run(
                 [
-                    engine,
+                    shutil.which(engine) or engine,
+                    "-ini",
+                    f"-jobname={fmt_name}",
                     "-interaction=nonstopmode",
                     "-output-directory",
-                    str(tmp_path),
+                    build_dir,
+                    f"&{engine}",
+                    "mylatex.ltx",
                     str(tex_file),
                 ],
                 check=True,
-                capture_output=True,
-                text=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
             )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return None
 
-            # Second compilation for references
-            subprocess.run(
-                [
-                    engine,
-                    "-interaction=nonstopmode",
-                    "-output-directory",
-                    str(tmp_path),
-                    str(tex_file),
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+        built = Path(build_dir) / f"{fmt_name}.fmt"
+        if not built.exists():
+            return None
+        os.chmod(built, 0o644)
+        os.replace(built, fmt_file)
 
-            pdf_file = tmp_path / "cv.pdf"
-            if not pdf_file.exists():
-                raise RuntimeError("PDF generation failed: output file not found")
+    return fmt_name, fmt_dir
 
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(pdf_file, output_path)
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"LaTeX compilation failed with {engine}: {e.stderr}") from e
-        except FileNotFoundError as e:
-            raise RuntimeError(
-                f"LaTeX engine '{engine}' not found. "
-                f"Please install a LaTeX distribution (e.g., TeX Live, MiKTeX)."
-            ) from e
+def _run_latex(tex_file: Path, engine: str, precompile_preamble: bool = False) -> Path:
+    """Compile a LaTeX file in place, rerunning only when the log asks for it.
+
+    Args:
+        tex_file: Path to the ``.tex`` source; outputs are written next to it.
+        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        precompile_preamble: If True, load the preamble from a cached format
+            file where the engine supports it.
+
+    Returns:
+        Path to the generated PDF.
+
+    Raises:
+        RuntimeError: If LaTeX compilation fails.
+    """
+    output_dir = tex_file.parent
+    log_file = tex_file.with_suffix(".log")
+    # An absolute executable path (together with close_fds=False and no cwd)
+    # lets subprocess use posix_spawn instead of fork+exec on POSIX.
+    executable = shutil.which(engine) or engine
+    inputs = ["-output-directory", str(output_dir), str(tex_file)]
+    argv = [executable, "-interaction=nonstopmode", *inputs]
+
+    fmt = _ensure_format(tex_file, engine) if precompile_preamble else None
+
+    try:
+        if fmt:
+            fmt_name, fmt_dir = fmt
+            # Trailing separator keeps kpathsea's default format search path.
+            env = {**os.environ, "TEXFORMATS": f"{fmt_dir}{os.pathsep}"}
+            try:
+                _run_passes(
+                    [executable, "-interaction=nonstopmode", f"-fmt={fmt_name}", *inputs],
+                    log_file,
+                    env,
+                )
+            except subprocess.CalledProcessError:
+                # The format may no longer load (e.g. it was dumped by another
+                # engine build); if a plain run succeeds, the format was at fault.
+                _run_passes(argv, log_file)
+                (fmt_dir / f"{fmt_name}.fmt").unlink(missing_ok=True)
+        else:
+            _run_passes(argv, log_file)
+    except subprocess.CalledProcessError as e:
+        details = _describe_failure(e, log_file)
+        raise RuntimeError(f"LaTeX compilation failed with {engine}: {details}") from e
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            f"LaTeX engine '{engine}' not found. "
+            f"Please install a LaTeX distribution (e.g., TeX Live, MiKTeX)."
+        ) from e
+
+    pdf_file = tex_file.with_suffix(".pdf")
+    if not pdf_file.exists():
+        raise RuntimeError("PDF generation failed: output file not found")
+    return pdf_file
+
+
+def _run_passes(argv: list[str], log_file: Path, env: dict[str, str] | None = None) -> None:
+    """Run a LaTeX engine until its log no longer asks for another pass.
+
+    Args:
+        argv: Engine command line.
+        log_file: Path to the ``.log`` file the run writes.
+        env: Environment for the engine, or None to inherit it.
+
+    Raises:
+        subprocess.CalledProcessError: If a pass fails.
+        FileNotFoundError: If the engine executable is missing.
+    """
+    for _ in range(_MAX_PASSES):
+        # Python-created descriptors are non-inheritable, so keeping
+        # close_fds=False leaks nothing into the engine process.
+        subprocess.run(
+            argv,
+            check=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+            env=env,
+        )
+        if not _needs_rerun(log_file):
+            break
+
+
+def _build_dir(output_path: Path) -> tempfile.TemporaryDirectory[str]:
+    """Create a scratch directory for a LaTeX run next to the output file.
+
+    Keeping it on the output's filesystem lets the finished PDF be renamed
+    into place instead of copied.
+
+    Args:
+        output_path: Path where the PDF should be saved.
+
+    Returns:
+        Temporary directory context manager.
+    """
+    return tempfile.TemporaryDirectory(prefix=".pixcel-", dir=output_path.parent)
+
+
+def _move_pdf(pdf_file: Path, output_path: Path) -> None:
+    """Move a compiled PDF to its destination.
+
+    Args:
+        pdf_file: Path to the PDF written by the engine.
+        output_path: Path where the PDF should be saved.
+    """
+    try:
+        os.replace(pdf_file, output_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystems (e.g. a bind mount below the output folder)
+        shutil.copy2(pdf_file, output_path)
+
+
+def _source_digest(tex_file: Path, engine: str, dependencies: Iterable[str]) -> str:
+    """Fingerprint everything a LaTeX run depends on.
+
+    Args:
+        tex_file: Path to the rendered ``.tex`` source.
+        engine: LaTeX engine used for the run.
+        dependencies: Paths of files the document includes (e.g. the portrait).
+
+    Returns:
+        Hex digest of the source, the engine and the dependencies' stat data.
+    """
+    digest = hashlib.blake2b(tex_file.read_bytes(), digest_size=16)
+    digest.update(engine.encode("utf-8"))
+    for dependency in dependencies:
+        try:
+            stat = os.stat(dependency)
+        except OSError:
+            digest.update(b"\0missing")
+        else:
+            digest.update(f"\0{stat.st_mtime_ns}:{stat.st_size}".encode("ascii"))
+    return digest.hexdigest()
+
+
+def _compile_document(
+    write_source: Callable[[Path], None],
+    tex_name: str,
+    output_path: Path,
+    engine: str,
+    precompile_preamble: bool,
+    force: bool,
+    dependencies: Iterable[str] = (),
+) -> None:
+    """Write a LaTeX source and compile it, skipping runs on unchanged input.
+
+    A digest of the source is kept next to the PDF in a ``.pixcel-hash``
+    file; when it matches and the PDF exists, the engine is not started.
+
+    Args:
+        write_source: Callback writing the LaTeX source to the given path.
+        tex_name: File name of the ``.tex`` source inside the build directory.
+        output_path: Path where the PDF should be saved.
+        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        force: If True, compile even if the output is up to date.
+        dependencies: Paths of files the document includes (e.g. the portrait).
+
+    Raises:
+        RuntimeError: If LaTeX compilation fails.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    hash_file = output_path.with_suffix(".pixcel-hash")
+
+    with _build_dir(output_path) as tmpdir:
+        # The source goes through a file rather than the engine's stdin: rerun
+        # passes, the preamble format and the up-to-date check all reread it.
+        tex_file = Path(tmpdir) / tex_name
+        write_source(tex_file)
+        digest = _source_digest(tex_file, engine, dependencies)
+
+        if not force and output_path.exists():
+            try:
+                if hash_file.read_text(encoding="ascii").strip() == digest:
+                    return
+            except (OSError, UnicodeDecodeError):
+                pass
+
+        pdf_file = _run_latex(tex_file, engine, precompile_preamble)
+        _move_pdf(pdf_file, output_path)
+
+    hash_file.write_text(f"{digest}\n", encoding="ascii")
+
+
+def compile_to_pdf(
+    cv: CurriculumVitae,
+    output_path: Path,
+    engine: str = "pdflatex",
+    precompile_preamble: bool = False,
+    force: bool = False,
+) -> None:
+    """Render CV and compile to PDF.
+
+    Args:
+        cv: The CV model to compile.
+        output_path: Path where the PDF should be saved.
+        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        force: If True, compile even if the PDF is up to date.
+
+    Raises:
+        RuntimeError: If LaTeX compilation fails.
+    """
+    _compile_cv(cv, output_path, engine, precompile_preamble, force)
+
+
+def _compile_cv(
+    cv: CurriculumVitae,
+    output_path: Path,
+    engine: str,
+    precompile_preamble: bool,
+    force: bool,
+    latex_content: str | None = None,
+) -> None:
+    """Compile CV to PDF, reusing already rendered LaTeX if given.
+
+    Args:
+        cv: The CV model to compile.
+        output_path: Path where the PDF should be saved.
+        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        force: If True, compile even if the PDF is up to date.
+        latex_content: Rendered LaTeX of ``cv``; streamed from the template if None.
+
+    Raises:
+        RuntimeError: If LaTeX compilation fails.
+    """
+    if latex_content is None:
+        def write_source(tex_file: Path) -> None:
+            _render_to(cv, tex_file)
+    else:
+        latex_bytes = latex_content.encode("utf-8")
+
+        def write_source(tex_file: Path) -> None:
+            tex_file.write_bytes(latex_bytes)
+
+    portrait = cv.contact.portrait_path
+    _compile_document(
+        write_source,
+        "cv.tex",
+        output_path,
+        engine,
+        precompile_preamble,
+        force,
+        dependencies=(portrait,) if portrait else (),
+    )
+
+
+def compile_many_to_pdf(
+    cvs: Mapping[str, CurriculumVitae],
+    output_dir: Path,
+    engine: str = "pdflatex",
+    precompile_preamble: bool = False,
+    max_workers: int | None = None,
+    force: bool = False,
+) -> dict[str, Path]:
+    """Compile several CVs to PDF concurrently.
+
+    Each CV runs in its own engine process; the worker threads only wait on
+    those processes, so a thread pool keeps all cores busy.
+
+    Args:
+        cvs: Mapping of output name (without ``.pdf``) to CV model.
+        output_dir: Directory where the PDFs should be saved.
+        engine: LaTeX engine to use (pdflatex, xelatex, lualatex).
+        precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+        max_workers: Maximum number of parallel compilations (defaults to CPU count).
+        force: If True, compile even the PDFs that are up to date.
+
+    Returns:
+        Mapping of output name to generated PDF path.
+
+    Raises:
+        RuntimeError: If any compilation fails; the others are still completed.
+    """
+    outputs = {name: output_dir / f"{name}.pdf" for name in cvs}
+
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            name: executor.submit(
+                compile_to_pdf, cv, outputs[name], engine, precompile_preamble, force
+            )
+            for name, cv in cvs.items()
+        }
+        errors = []
+        for name, future in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                errors.append(f"{name}: {exc}")
+
+    if errors:
+        raise RuntimeError("Batch compilation failed for:\n" + "\n".join(errors))
+    return outputs
 
 
 # Legacy class for backward compatibility
@@ -96,23 +500,36 @@ class CVGenerator:
             cv: The CV model to render.
         """
         self.cv = cv
+        self._latex: str | None = None
 
     def to_latex(self) -> str:
         """Generate LaTeX source from CV model.
 
+        The result is rendered once and reused by later calls and by ``to_pdf``.
+
         Returns:
             LaTeX document string.
         """
-        return render_cv(self.cv)
-
-    def to_pdf(self, output_path: Path, engine: str = "pdflatex") -> None:
+        if self._latex is None:
+            self._latex = render_cv(self.cv)
+        return self._latex
+
+    def to_pdf(
+        self,
+        output_path: Path,
+        engine: str = "pdflatex",
+        precompile_preamble: bool = False,
+        force: bool = False,
+    ) -> None:
         """Generate PDF from CV model.
 
         Args:
             output_path: Path where the PDF should be saved.
             engine: LaTeX engine to use.
+            precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+            force: If True, compile even if the PDF is up to date.
         """
-        compile_to_pdf(self.cv, output_path, engine)
+        _compile_cv(self.cv, output_path, engine, precompile_preamble, force, self._latex)
 
 class AnschreibenGenerator:
     """Generate LaTeX Anschreiben (cover letter) from Anschreiben model."""
@@ -124,63 +541,49 @@ class AnschreibenGenerator:
             anschreiben: The Anschreiben model to render.
         """
         self.anschreiben = anschreiben
+        self._latex: str | None = None
 
     def to_latex(self) -> str:
         """Generate LaTeX source from Anschreiben model.
 
+        The result is rendered once and reused by later calls and by ``to_pdf``.
+
         Returns:
             LaTeX document string.
         """
-        template = load_anschreiben_template()
-        return template.render(anschreiben=self.anschreiben)
-
-    def to_pdf(self, output_path: Path, engine: str = "pdflatex") -> None:
+        if self._latex is None:
+            template = load_anschreiben_template()
+            self._latex = template.render(anschreiben=self.anschreiben)
+        return self._latex
+
+    def to_pdf(
+        self,
+        output_path: Path,
+        engine: str = "pdflatex",
+        precompile_preamble: bool = False,
+        force: bool = False,
+    ) -> None:
         """Generate PDF from Anschreiben model.
 
         Args:
             output_path: Path where the PDF should be saved.
             engine: LaTeX engine to use.
+            precompile_preamble: If True, reuse a cached preamble format (pdflatex only).
+            force: If True, compile even if the PDF is up to date.
 
         Raises:
             RuntimeError: If LaTeX compilation fails.
         """
-        latex_content = self.to_latex()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            tex_file = tmp_path / "anschreiben.tex"
-            tex_file.write_text(latex_content, encoding="utf-8")
-
-            try:
-                # First compilation
-                subprocess.run(
-                    [
-                        engine,
-                        "-interaction=nonstopmode",
-                        "-output-directory",
-                        str(tmp_path),
-                        str(tex_file),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
-
-                # Second compilation (for LaTeX references)
-                subprocess.run(
-                    [
-                        engine,
-                        "-interaction=nonstopmode",
-                        "-output-directory",
-                        str(tmp_path),
-                        str(tex_file),
-                    ],
-                    check=True,
-                    capture_output=True,
-                )
-
-                pdf_file = tmp_path / "anschreiben.pdf"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(pdf_file, output_path)
-
-            except subprocess.CalledProcessError as e:
-                raise RuntimeError(f"LaTeX compilation failed: {e.stderr.decode()}") from e
\ No newline at end of file
+        latex_bytes = self.to_latex().encode("utf-8")
+
+        def write_source(tex_file: Path) -> None:
+            tex_file.write_bytes(latex_bytes)
+
+        _compile_document(
+            write_source,
+            "anschreiben.tex",
+            output_path,
+            engine,
+            precompile_preamble,
+            force,
+        )
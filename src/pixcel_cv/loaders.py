@@ -1,12 +1,106 @@
 """YAML loader for CV data."""
 
+import copy
+import functools
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import re
+import warnings
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import ValidationError
+
+try:
+    # libyaml-backed parser and emitter, several times faster than the pure-Python ones
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+    warnings.warn(
+        "PyYAML C extension not available; install PyYAML built against libyaml "
+        "for 3-4x faster CV loads",
+        RuntimeWarning,
+        stacklevel=2,
+    )
 
+from . import models
+from .cache import cache_dir, is_private, private_cache_dir
 from .models import Certification, ContactInfo, CurriculumVitae, Language, Skill, Anschreiben, PostalAddress
 
+# Data files read by load_cv_from_yaml_folder from the data folder, as
+# (name, file name, factory for the value used when the file is missing or empty)
+_CV_DATA_FILES: tuple[tuple[str, str, type[dict] | type[list]], ...] = (
+    ("cv_basis", "cv_basis.yaml", dict),
+    ("berufliche_stationen", "berufliche_stationen.yaml", dict),
+    ("basedata", "basedata.yaml", dict),
+    ("missionstatement", "missionstatement.yaml", list),
+    ("skills", "skills.yaml", dict),
+    ("projects", "projekt_historie.yaml", dict),
+    ("certifications", "certifications.yaml", dict),
+)
+
+# Config file read by load_cv_from_yaml_folder from the config folder
+_CV_CONFIG_FILE = "cv_config.yaml"
+
+# Upper bound on threads reading YAML files of one folder concurrently
+_MAX_LOAD_WORKERS = 8
+
+# YAML files larger than this (in bytes) are parsed from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+# Languages listed on every CV built from a folder; the models are shared
+# between CVs, so treat them as read-only
+_DEFAULT_LANGUAGES = (
+    Language(name="Deutsch", level="Muttersprache"),
+    Language(name="Englisch", level="Fließend"),
+)
+
+# Headings of work and education entries; optional parts are passed in
+# pre-formatted (with their separator) or as empty strings
+_STATION_HEADER_TMPL = "\\textbf{{{position}}} \\\\\n{unternehmen}{ort_part} ({start} -- {bis})\n\n"
+_BILDUNG_HEADER_TMPL = "\\textbf{{{abschluss}}} \\\\\n{institution}{ort_part}{jahr_part}\n"
+
+# Availability fields of basedata.yaml profile_data as (label, key), in CV order
+_AVAILABILITY_FIELDS = (
+    ("Verfügbar ab", "available_from"),
+    ("Kündigungsfrist", "availability_notice_period"),
+    ("Bereitschaft zu Reisen", "willing_to_travel"),
+    ("Beschäftigungsart", "employment_status"),
+)
+
+# Accepted shape of certification dates given as strings (YYYY-M-D, as with
+# strptime("%Y-%m-%d"), so single-digit months and days are allowed)
+_CERT_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+# Replacements for characters with a special meaning in LaTeX, applied in one pass
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": "\\textbackslash{}",
+        "{": "\\{",
+        "}": "\\}",
+        "$": "\\$",
+        "&": "\\&",
+        "%": "\\%",
+        "#": "\\#",
+        "_": "\\_",
+        "^": "\\^{}",
+        "~": "\\textasciitilde{}",
+    }
+)
+# Matches any character _LATEX_ESCAPES replaces
+_LATEX_SPECIALS_RE = re.compile(f"[{re.escape(''.join(map(chr, _LATEX_ESCAPES)))}]")
+
 
 def load_cv_from_yaml(file_path: Path | str) -> CurriculumVitae:
     """Load CV from YAML file.
@@ -17,11 +111,9 @@ def load_cv_from_yaml(file_path: Path | str) -> CurriculumVitae:
     Returns:
         CurriculumVitae model instance.
     """
-    file_path = Path(file_path)
-    with open(file_path, encoding="utf-8") as f:
-        data: dict[str, Any] = yaml.safe_load(f)
+    data: dict[str, Any] = _parse_yaml_cached(Path(file_path))
 
-    return CurriculumVitae(**data)
+    return CurriculumVitae.model_validate(data)
 
 
 def load_cv_from_yaml_folder(
@@ -45,30 +137,62 @@ def load_cv_from_yaml_folder(
     else:
         config_folder = Path(config_folder)
 
+    sources = [folder_path / filename for _, filename, _ in _CV_DATA_FILES]
+    sources.append(config_folder / _CV_CONFIG_FILE)
+    cache_file, digest = _cv_cache_entry(sources, portrait_path)
+
+    cv = _read_cv_cache(cache_file, digest)
+    if cv is None:
+        cv = _build_cv_from_yaml_folder(folder_path, config_folder, portrait_path)
+        _write_cv_cache(cache_file, digest, cv)
+    return cv
+
+
+def _build_cv_from_yaml_folder(
+    folder_path: Path, config_folder: Path, portrait_path: str | None
+) -> CurriculumVitae:
+    """Build CV from the YAML files in a data folder and a config folder.
+
+    Args:
+        folder_path: Path to folder containing YAML files (data files).
+        config_folder: Path to folder containing cv_config.yaml.
+        portrait_path: Optional path to portrait picture file.
+
+    Returns:
+        CurriculumVitae model instance.
+    """
     # Load all YAML files - NEW STRUCTURE
-    # Data files from primary folder (typically OneDrive)
-    cv_basis = _load_yaml_file(folder_path / "cv_basis.yaml") or {}
-    berufliche_stationen = _load_yaml_file(folder_path / "berufliche_stationen.yaml") or {}
-    basedata = _load_yaml_file(folder_path / "basedata.yaml") or {}
-    missionstatement = _load_yaml_file(folder_path / "missionstatement.yaml") or []
-    skills_data = _load_yaml_file(folder_path / "skills.yaml") or {"skills": []}
-    projects = _load_yaml_file(folder_path / "projekt_historie.yaml") or {"projects": []}
-    certifications_data = _load_yaml_file(folder_path / "certifications.yaml") or {"certifications": []}
-    
-    # Config file from config folder (typically local ./yaml)
-    cv_config = _load_yaml_file(config_folder / "cv_config.yaml") or {}
+    # Data files from primary folder (typically OneDrive), config file from
+    # config folder (typically local ./yaml); read concurrently.
+    paths = [folder_path / filename for _, filename, _ in _CV_DATA_FILES]
+    paths.append(config_folder / _CV_CONFIG_FILE)
+    *contents, cv_config = _load_yaml_files(paths)
+
+    data = {
+        name: content or default()
+        for (name, _, default), content in zip(_CV_DATA_FILES, contents, strict=True)
+    }
+    cv_basis = data["cv_basis"]
+    berufliche_stationen = data["berufliche_stationen"]
+    basedata = data["basedata"]
+    skills_data = data["skills"]
+    projects = data["projects"]
+    certifications_data = data["certifications"]
+    cv_config = cv_config or {}
+
+    # Profile from basedata.yaml (OLD STRUCTURE), used for fallbacks below
+    profile = basedata.get("profile_data") or {}
 
     # Build contact info from cv_basis.yaml (NEW STRUCTURE)
     persoenliche_daten = cv_basis.get("persoenliche_daten", {})
 
     # Fallback to old structure if cv_basis doesn't exist
     if not persoenliche_daten:
-        profile = basedata.get("profile_data", {})
         persoenliche_daten = {
-            "name": profile.get("name", {}).get("de", ""),
+            "name": _get_de(profile, "name"),
             "email": profile.get("email", ""),
             "telefon": profile.get("phone", ""),
-            "adresse": profile.get("location", {}).get("de", ""),
+            "adresse": _get_de(profile, "location"),
         }
 
     # Use provided portrait_path or load from cv_config
@@ -77,43 +201,34 @@ def load_cv_from_yaml_folder(
     contact = ContactInfo(
         name=persoenliche_daten.get("name", ""),
         email=persoenliche_daten.get("email", ""),
-        title=persoenliche_daten.get("titel") or basedata.get("profile_data", {}).get("title", {}).get("de", ""),
+        title=persoenliche_daten.get("titel") or _get_de(profile, "title"),
         phone=persoenliche_daten.get("telefon", ""),
         location=f"{persoenliche_daten.get('adresse', '')}, {persoenliche_daten.get('plz_ort', '')}".strip(
             ", "
         ),
-        website=basedata.get("profile_data", {}).get("website", ""),
-        linkedin=persoenliche_daten.get("linkedin", "") or basedata.get("profile_data", {}).get("linkedin", ""),
-        github=persoenliche_daten.get("github", "") or basedata.get("profile_data", {}).get("github", ""),
+        website=profile.get("website", ""),
+        linkedin=persoenliche_daten.get("linkedin", "") or profile.get("linkedin", ""),
+        github=persoenliche_daten.get("github", "") or profile.get("github", ""),
         portrait_path=portrait,
     )
 
     # Build professional profile - prefer short version from cv_basis
-    berufliches_profil = ""
-    
-    cv_sections = cv_basis.get("sections", {})
-    berufliches_profil = cv_sections.get("berufliches_profil", {}).get("de", "")
+    cv_sections = cv_basis.get("sections") or {}
+    berufliches_profil = _get_de(cv_sections, "berufliches_profil")
     
     # Build skills from skills.yaml - group by category
-    skills_by_category: dict[str, list[str]] = {}
+    skills_by_category: defaultdict[str, list[str]] = defaultdict(list)
     if skills_data.get("skills"):
         for skill in skills_data["skills"]:
-            category = skill.get("category", "Sonstige")
-            title = skill.get("title", "")
-            if category not in skills_by_category:
-                skills_by_category[category] = []
-            skills_by_category[category].append(title)
+            skills_by_category[skill.get("category", "Sonstige")].append(skill.get("title", ""))
 
-    # Convert to skills list
+    # Convert to skills list; categories are listed alphabetically in the CV
     skills_list = [
         Skill(category=cat, items=items) for cat, items in sorted(skills_by_category.items())
     ]
 
     # Build languages
-    languages = [
-        Language(name="Deutsch", level="Muttersprache"),
-        Language(name="Englisch", level="Fließend"),
-    ]
+    languages = list(_DEFAULT_LANGUAGES)
 
     # Create custom sections for additional content
     custom_sections: dict[str, str] = {}
@@ -121,114 +236,21 @@ def load_cv_from_yaml_folder(
     # Add work experience section (NEW STRUCTURE)
     stationen = berufliche_stationen.get("berufliche_stationen", [])
     if stationen:
-        work_text = ""
-        for station in stationen:
-            position = station.get("position", "")
-            unternehmen = station.get("unternehmen", "")
-            ort = station.get("ort", "")
-            start = station.get("start", "")
-            bis = station.get("bis", "")
-
-            # Escape LaTeX
-            position_safe = _escape_latex(position)
-            unternehmen_safe = _escape_latex(unternehmen)
-            ort_safe = _escape_latex(ort)
-            start_safe = _escape_latex(start)
-            bis_safe = _escape_latex(bis)
-
-            # Build entry
-            work_text += f"\\textbf{{{position_safe}}} \\\\\n"
-            work_text += f"{unternehmen_safe}"
-            if ort:
-                work_text += f", {ort_safe}"
-            work_text += f" ({start_safe} -- {bis_safe})\n\n"
-
-            # Add Schwerpunkte if available
-            if station.get("schwerpunkte"):
-                work_text += "\\textit{Schwerpunkte:}\n"
-                work_text += "\\begin{itemize}\n"
-                for sp in station.get("schwerpunkte", []):
-                    work_text += f"  \\item {_escape_latex(sp)}\n"
-                work_text += "\\end{itemize}\n"
-
-            # Add Aufgaben if available
-            if station.get("aufgaben"):
-                work_text += "\\textit{Aufgaben:}\n"
-                work_text += "\\begin{itemize}\n"
-                for aufgabe in station.get("aufgaben", []):
-                    work_text += f"  \\item {_escape_latex(aufgabe)}\n"
-                work_text += "\\end{itemize}\n"
-
-            # Add Tätigkeit if available (fallback for simpler entries)
-            if station.get("tätigkeit") and not station.get("aufgaben"):
-                work_text += f"{_escape_latex(station.get('tätigkeit', ''))}\n"
-
-            # Add Hauptprojekt if available
-            if station.get("hauptprojekt"):
-                work_text += f"\\textit{{Hauptprojekt:}} {_escape_latex(station.get('hauptprojekt', ''))}\n"
-
-            # Add Projektaufgaben if available
-            if station.get("projektaufgaben"):
-                work_text += "\\begin{itemize}\n"
-                for pa in station.get("projektaufgaben", []):
-                    work_text += f"  \\item {_escape_latex(pa)}\n"
-                work_text += "\\end{itemize}\n"
-
-            # Add spacing between entries
-            work_text += "\n"
-
-        if work_text:
-            custom_sections["Beruflicher Werdegang"] = work_text.strip()
+        # Every station yields a heading, so the section is never empty here
+        work_text = "".join(_format_station(station) for station in stationen)
+        custom_sections["Beruflicher Werdegang"] = work_text.strip()
 
     # Add education section (NEW STRUCTURE)
     bildungsweg = cv_basis.get("bildungsweg", [])
     if bildungsweg:
-        education_text = ""
-        for bildung in bildungsweg:
-            institution = bildung.get("institution", "")
-            abschluss = bildung.get("abschluss", "")
-            jahr = bildung.get("jahr", "")
-            ort = bildung.get("ort", "")
-            schwerpunkte = bildung.get("schwerpunkte", [])
-            gesamtnote = bildung.get("gesamtnote", "")
-
-            # Escape LaTeX
-            institution_safe = _escape_latex(institution)
-            abschluss_safe = _escape_latex(abschluss)
-            jahr_safe = _escape_latex(jahr)
-            ort_safe = _escape_latex(ort) if ort else ""
-            gesamtnote_safe = _escape_latex(gesamtnote) if gesamtnote else ""
-
-            # Build entry
-            education_text += f"\\textbf{{{abschluss_safe}}} \\\\\n"
-            education_text += f"{institution_safe}"
-            if ort:
-                education_text += f", {ort_safe}"
-            if jahr:
-                education_text += f" ({jahr_safe})"
-            education_text += "\n"
-
-            # Add Schwerpunkte if available
-            if schwerpunkte:
-                education_text += "\\textit{Schwerpunkte:} "
-                education_text += ", ".join([_escape_latex(sp) for sp in schwerpunkte])
-                education_text += "\n"
-
-            # Add Gesamtnote if available
-            if gesamtnote:
-                education_text += f"\\textit{{Gesamtnote:}} {gesamtnote_safe}\n"
-
-            # Add spacing between entries
-            education_text += "\n"
-
-        if education_text:
-            custom_sections["Bildungsweg"] = education_text.strip()
+        education_text = "".join(_format_bildung(bildung) for bildung in bildungsweg)
+        custom_sections["Bildungsweg"] = education_text.strip()
 
     # Add availability info
-    profile = basedata.get("profile_data", {})
-    availability_text = _build_availability_section(profile)
-    if availability_text:
-        custom_sections["Verfügbarkeit"] = availability_text
+    if profile:
+        availability_text = _build_availability_section(profile)
+        if availability_text:
+            custom_sections["Verfügbarkeit"] = availability_text
 
     # Add projects as a custom section
     projects_list = projects.get("projects", [])
@@ -237,64 +259,49 @@ def load_cv_from_yaml_folder(
     filtered_projects = [p for p in projects_list if p.get("include_in_cv", False)]
 
     if filtered_projects:
-        projects_text = ""
-        for project in filtered_projects:
-            title = project.get("project_de", "")
-            period_from = project.get("period_from", "")
-            period_to = project.get("period_to", "")
-            description = project.get("description_de", "")
-            tools = ", ".join(project.get("tools_libraries", []))
-
-            if title:
-                # Escape special LaTeX characters
-                title_safe = _escape_latex(title)
-                period_from_safe = _escape_latex(str(period_from))
-                period_to_safe = _escape_latex(str(period_to))
-                # Convert bullet points to proper LaTeX itemize lists
-                description_safe = _convert_bullets_to_itemize(description)
-                tools_safe = _escape_latex(tools)
-
-                projects_text += (
-                    f"\\textbf{{{title_safe}}} ({period_from_safe} -- {period_to_safe})\n\n"
-                )
-                if description_safe:
-                    projects_text += f"{description_safe}\n\n"
-                if tools_safe:
-                    projects_text += f"\\textit{{Technologien: {tools_safe}}}\n\n"
-
+        projects_text = "".join(_format_project(project) for project in filtered_projects)
         if projects_text:
             custom_sections["Referenzprojekte"] = projects_text.strip()
 
     # Process certifications from YAML
     certifications_list = []
-    for cert in certifications_data.get("certifications", []):
-        try:
-            # Parse date if provided, otherwise use None
-            cert_date = cert.get("date")
-            if cert_date:
-                # Try to parse as date (YYYY-MM-DD format)
-                from datetime import datetime
-                if isinstance(cert_date, str):
-                    cert_date = datetime.strptime(cert_date, "%Y-%m-%d").date()
-            else:
-                # If no date, use today's date as fallback
-                from datetime import date
-                cert_date = date.today()
-            
-            certification = Certification(
-                title=cert.get("title", ""),
-                issuer=cert.get("issuer", ""),
-                date=cert_date,
-                credential_id=cert.get("credential_id"),
-                credential_url=cert.get("credential_url"),
-            )
+    certifications = certifications_data.get("certifications")
+    if certifications:
+        today = date.today()
+        for cert in certifications:
+            if not isinstance(cert, dict):
+                # Skip invalid certifications
+                continue
+
+            # Parse date if provided, otherwise use today's date as fallback
+            cert_date = cert.get("date") or today
+            if isinstance(cert_date, str):
+                # Only YYYY-MM-DD strings are accepted
+                match = _CERT_DATE_RE.fullmatch(cert_date)
+                if not match:
+                    continue
+                try:
+                    cert_date = date(*map(int, match.groups()))
+                except ValueError:
+                    # Well-formed but impossible date, e.g. 2024-02-30
+                    continue
+
+            try:
+                certification = Certification(
+                    title=cert.get("title", ""),
+                    issuer=cert.get("issuer", ""),
+                    date=cert_date,
+                    credential_id=cert.get("credential_id"),
+                    credential_url=cert.get("credential_url"),
+                )
+            except ValidationError:
+                # Skip invalid certifications
+                continue
             certifications_list.append(certification)
-        except Exception:
-            # Skip invalid certifications
-            pass
 
-    # Create CurriculumVitae instance
-    cv = CurriculumVitae(
+    # Create CurriculumVitae instance; every nested model was validated above,
+    # so the top-level validation pass would only re-check them
+    cv = CurriculumVitae.model_construct(
         contact=contact,
         berufliches_profil=berufliches_profil,
         work_experience=[],
@@ -311,20 +318,426 @@ def load_cv_from_yaml_folder(
     return cv
 
 
-def _load_yaml_file(file_path: Path) -> dict[str, Any] | list[Any] | None:
+def _cv_cache_entry(sources: list[Path], portrait_path: str | None) -> tuple[Path | None, str]:
+    """Locate the JSON cache entry for a merged CV and fingerprint its inputs.
+
+    The entry is named after the source paths, so each folder combination
+    keeps a single cache file. The digest covers the raw bytes of every YAML
+    source, the loader code, and today's date (certifications without a date
+    fall back to today).
+
+    Args:
+        sources: YAML files the CV is built from; missing files are allowed.
+        portrait_path: Optional path to portrait picture file.
+
+    Returns:
+        Tuple of cache file path (None if the cache is unavailable) and digest.
+    """
+    digest = hashlib.sha256()
+    for module_file in (__file__, models.__file__):
+        stat = os.stat(module_file)
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size}\0".encode())
+    digest.update(f"{portrait_path}\0{date.today().isoformat()}\0".encode())
+
+    name = hashlib.sha256()
+    for source in sources:
+        name.update(str(source.absolute()).encode() + b"\0")
+        try:
+            digest.update(source.read_bytes())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+    name.update(str(portrait_path).encode())
+
+    try:
+        cache_file: Path | None = cache_dir("cv") / f"{name.hexdigest()[:32]}.json"
+    except OSError:
+        cache_file = None
+    return cache_file, digest.hexdigest()
+
+
+def _read_cv_cache(cache_file: Path | None, digest: str) -> CurriculumVitae | None:
+    """Load a cached CV if it was built from identical inputs.
+
+    Args:
+        cache_file: Cache file path, or None if the cache is unavailable.
+        digest: Fingerprint of the current inputs.
+
+    Returns:
+        CurriculumVitae model instance, or None on a cache miss.
+    """
+    if cache_file is None:
+        return None
+    try:
+        raw = cache_file.read_bytes()
+    except OSError:
+        return None
+
+    stored_digest, _, payload = raw.partition(b"\n")
+    if stored_digest != digest.encode():
+        return None
+    try:
+        return CurriculumVitae.model_validate_json(payload)
+    except ValidationError:
+        return None
+
+
+def _write_cv_cache(cache_file: Path | None, digest: str, cv: CurriculumVitae) -> None:
+    """Store a merged CV in the JSON cache, ignoring write failures.
+
+    Args:
+        cache_file: Cache file path, or None if the cache is unavailable.
+        digest: Fingerprint of the inputs the CV was built from.
+        cv: CurriculumVitae model instance.
+    """
+    if cache_file is None:
+        return
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_file.write_bytes(digest.encode() + b"\n" + cv.model_dump_json().encode())
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _load_yaml_file(
+    file_path: Path, present: set[str] | None = None
+) -> dict[str, Any] | list[Any] | None:
     """Load a single YAML file.
 
     Args:
         file_path: Path to YAML file.
+        present: Casefolded names of the entries in the file's folder, if
+            already listed; files not in it are skipped without touching the
+            filesystem.
 
     Returns:
         Parsed YAML content or None if file doesn't exist.
     """
-    if not file_path.exists():
+    # A casefolded match may still differ in case; the stat below decides, so
+    # case-insensitive filesystems (APFS, NTFS) find e.g. CV_Basis.yaml as before
+    if present is not None and file_path.name.casefold() not in present:
+        return None
+
+    # Let the stat in _parse_yaml_cached report missing files instead of probing first
+    try:
+        return _parse_yaml_cached(file_path)
+    except FileNotFoundError:
+        return None
+
+
+def _load_yaml_files(file_paths: list[Path]) -> list[dict[str, Any] | list[Any] | None]:
+    """Load several YAML files concurrently.
+
+    The files are small, so their cost is mostly open/read latency, which is
+    noticeable on network or OneDrive-backed folders; threads overlap it.
+    Each folder is listed once up front instead of probing every file.
+
+    Args:
+        file_paths: Paths to YAML files.
+
+    Returns:
+        Parsed YAML content per path, None for files that don't exist.
+    """
+    listings = {parent: _list_folder(parent) for parent in {path.parent for path in file_paths}}
+
+    workers = min(_MAX_LOAD_WORKERS, len(file_paths)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(lambda path: _load_yaml_file(path, listings[path.parent]), file_paths)
+        )
+
+
+def _list_folder(folder_path: Path) -> set[str] | None:
+    """List the entry names of a folder with a single scandir call.
+
+    Names are casefolded: a file missing from the listing is absent on both
+    case-sensitive and case-insensitive filesystems.
+
+    Args:
+        folder_path: Folder to list.
+
+    Returns:
+        Casefolded entry names; empty if the folder doesn't exist, None if it
+        can't be listed (e.g. no read permission), so callers fall back to
+        opening each file.
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            return {entry.name.casefold() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+    except OSError:
+        return None
+
+
+def _parse_yaml_cached(file_path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while it is unchanged.
+
+    Args:
+        file_path: Path to YAML file.
+
+    Returns:
+        Private copy of the parsed YAML content.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    path = file_path.absolute()
+    stat = path.stat()
+    data = _parse_yaml(str(path), stat.st_mtime_ns, stat.st_size)
+
+    # Callers fill in defaults on the returned dicts, so never hand out the cached object
+    return copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_yaml(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file once per (path, mtime, size) combination.
+
+    The stat values are only part of the cache key: an edited file gets a
+    new key and is parsed again, while stale entries age out of the LRU.
+    Across processes, a pickled copy in the on-disk cache stands in for the
+    YAML parse while the stat values match.
+
+    Args:
+        path: Absolute path to YAML file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Parsed YAML content, shared between callers and not to be mutated.
+    """
+    cache_file = _yaml_cache_file(path)
+    if cache_file is not None:
+        try:
+            with open(cache_file, "rb") as f:
+                # Unpickling runs code; only trust files nobody else could have written
+                if is_private(os.fstat(f.fileno())):
+                    cached_mtime_ns, cached_size, data = pickle.load(f)
+                    if cached_mtime_ns == mtime_ns and cached_size == size:
+                        return data
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            # Missing, truncated or foreign cache file: parse the YAML instead
+            pass
+
+    if size > _MMAP_THRESHOLD:
+        # Large files are parsed from a read-only mapping in chunks instead of
+        # first copying the whole file into a bytes object
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = yaml.load(mm, Loader=_SafeLoader)
+    else:
+        # libyaml decodes the UTF-8 bytes itself; no text-mode file object needed
+        data = yaml.load(Path(path).read_bytes(), Loader=_SafeLoader)
+
+    if cache_file is not None:
+        _write_yaml_cache(cache_file, (mtime_ns, size, data))
+    return data
+
+
+def _yaml_cache_file(path: str) -> Path | None:
+    """Locate the pickled copy of a YAML file in the on-disk cache.
+
+    The cache holds pickles, so it is only used in a directory that belongs
+    to the current user and not writable by group or others.
+
+    Args:
+        path: Absolute path to YAML file.
+
+    Returns:
+        Path of the cache file, or None if the cache is not writable or not
+        owned by the current user.
+    """
+    directory = private_cache_dir("yaml")
+    if directory is None:
         return None
+    name = hashlib.sha256(path.encode("utf-8")).hexdigest()[:32]
+    return directory / f"{name}.pkl"
 
-    with open(file_path, encoding="utf-8") as f:
-        return yaml.safe_load(f)
+
+def _write_yaml_cache(cache_file: Path, entry: tuple[int, int, Any]) -> None:
+    """Store a parsed YAML file in the on-disk cache, ignoring write failures.
+
+    Args:
+        cache_file: Path of the cache file.
+        entry: Modification time, size and parsed data of the YAML file.
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "wb", opener=_private_opener) as f:
+            pickle.dump(entry, f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _private_opener(path: str, flags: int) -> int:
+    """Open a new file readable and writable by its owner only.
+
+    Args:
+        path: Path of the file.
+        flags: Flags passed by ``open``.
+
+    Returns:
+        File descriptor.
+    """
+    return os.open(path, flags, 0o600)
+
+
+def _format_station(station: dict[str, Any]) -> str:
+    """Format one berufliche Station as a LaTeX entry.
+
+    Args:
+        station: Station data from berufliche_stationen.yaml.
+
+    Returns:
+        LaTeX snippet for the station, ending with a blank line.
+    """
+    parts: list[str] = []
+    position = station.get("position", "")
+    unternehmen = station.get("unternehmen", "")
+    ort = station.get("ort", "")
+    start = station.get("start", "")
+    bis = station.get("bis", "")
+
+    # Escape LaTeX
+    position_safe, unternehmen_safe, ort_safe, start_safe, bis_safe = _escape_latex_many(
+        (position, unternehmen, ort, start, bis)
+    )
+
+    # Build entry
+    parts.append(
+        _STATION_HEADER_TMPL.format(
+            position=position_safe,
+            unternehmen=unternehmen_safe,
+            ort_part=f", {ort_safe}" if ort else "",
+            start=start_safe,
+            bis=bis_safe,
+        )
+    )
+
+    # Add Schwerpunkte if available
+    if station.get("schwerpunkte"):
+        parts.append("\\textit{Schwerpunkte:}\n")
+        parts.append(_itemize(station["schwerpunkte"]))
+
+    # Add Aufgaben if available
+    if station.get("aufgaben"):
+        parts.append("\\textit{Aufgaben:}\n")
+        parts.append(_itemize(station["aufgaben"]))
+
+    # Add Tätigkeit if available (fallback for simpler entries)
+    if station.get("tätigkeit") and not station.get("aufgaben"):
+        parts.append(f"{_escape_latex(station.get('tätigkeit', ''))}\n")
+
+    # Add Hauptprojekt if available
+    if station.get("hauptprojekt"):
+        parts.append(f"\\textit{{Hauptprojekt:}} {_escape_latex(station.get('hauptprojekt', ''))}\n")
+
+    # Add Projektaufgaben if available
+    if station.get("projektaufgaben"):
+        parts.append(_itemize(station["projektaufgaben"]))
+
+    # Add spacing between entries
+    parts.append("\n")
+
+    return "".join(parts)
+
+
+def _itemize(items: list[str]) -> str:
+    """Format items as a LaTeX itemize list.
+
+    Args:
+        items: Unescaped list items.
+
+    Returns:
+        LaTeX itemize environment, ending with a newline.
+    """
+    body = "".join([f"  \\item {_escape_latex(item)}\n" for item in items])
+    return f"\\begin{{itemize}}\n{body}\\end{{itemize}}\n"
+
+
+def _format_bildung(bildung: dict[str, Any]) -> str:
+    """Format one Bildungsweg entry as a LaTeX entry.
+
+    Args:
+        bildung: Education data from the bildungsweg list in cv_basis.yaml.
+
+    Returns:
+        LaTeX snippet for the entry, ending with a blank line.
+    """
+    parts: list[str] = []
+    institution = bildung.get("institution", "")
+    abschluss = bildung.get("abschluss", "")
+    jahr = bildung.get("jahr", "")
+    ort = bildung.get("ort", "")
+    schwerpunkte = bildung.get("schwerpunkte", [])
+    gesamtnote = bildung.get("gesamtnote", "")
+
+    # Escape LaTeX
+    institution_safe, abschluss_safe, jahr_safe, ort_safe, gesamtnote_safe = _escape_latex_many(
+        (institution, abschluss, jahr, ort or "", gesamtnote or "")
+    )
+
+    # Build entry
+    parts.append(
+        _BILDUNG_HEADER_TMPL.format(
+            abschluss=abschluss_safe,
+            institution=institution_safe,
+            ort_part=f", {ort_safe}" if ort else "",
+            jahr_part=f" ({jahr_safe})" if jahr else "",
+        )
+    )
+
+    # Add Schwerpunkte if available
+    if schwerpunkte:
+        parts.append("\\textit{Schwerpunkte:} ")
+        parts.append(", ".join(_escape_latex_many(schwerpunkte)))
+        parts.append("\n")
+
+    # Add Gesamtnote if available
+    if gesamtnote:
+        parts.append(f"\\textit{{Gesamtnote:}} {gesamtnote_safe}\n")
+
+    # Add spacing between entries
+    parts.append("\n")
+
+    return "".join(parts)
+
+
+def _format_project(project: dict[str, Any]) -> str:
+    """Format one reference project as a LaTeX entry.
+
+    Args:
+        project: Project data from projekt_historie.yaml.
+
+    Returns:
+        LaTeX snippet for the project, or an empty string if it has no title.
+    """
+    title = project.get("project_de", "")
+    if not title:
+        return ""
+
+    period_from = project.get("period_from", "")
+    period_to = project.get("period_to", "")
+    description = project.get("description_de", "")
+    tools = ", ".join(project.get("tools_libraries", []))
+
+    # Escape special LaTeX characters
+    title_safe = _escape_latex(title)
+    period_from_safe = _escape_latex(str(period_from))
+    period_to_safe = _escape_latex(str(period_to))
+    # Convert bullet points to proper LaTeX itemize lists
+    description_safe = _convert_bullets_to_itemize(description)
+    tools_safe = _escape_latex(tools)
+
+    parts = [f"\\textbf{{{title_safe}}} ({period_from_safe} -- {period_to_safe})\n\n"]
+    if description_safe:
+        parts.append(f"{description_safe}\n\n")
+    if tools_safe:
+        parts.append(f"\\textit{{Technologien: {tools_safe}}}\n\n")
+
+    return "".join(parts)
 
 
 def _build_availability_section(profile: dict) -> str:
@@ -337,44 +750,31 @@ def _build_availability_section(profile: dict) -> str:
         Formatted availability text.
     """
     lines = []
+    for label, key in _AVAILABILITY_FIELDS:
+        value = _get_de(profile, key)
+        if value:
+            lines.append(f"\\textbf{{{label}:}} {_escape_latex(value)}")
+
+    return " \\newline ".join(lines)
 
-    if profile.get("available_from"):
-        available = profile.get("available_from", {})
-        if isinstance(available, dict):
-            available_de = available.get("de", "")
-        else:
-            available_de = str(available)
-        if available_de:
-            lines.append(f"\\textbf{{Verfügbar ab:}} {_escape_latex(available_de)}")
-
-    if profile.get("availability_notice_period"):
-        notice = profile.get("availability_notice_period", {})
-        if isinstance(notice, dict):
-            notice_de = notice.get("de", "")
-        else:
-            notice_de = str(notice)
-        if notice_de:
-            lines.append(f"\\textbf{{Kündigungsfrist:}} {_escape_latex(notice_de)}")
-
-    if profile.get("willing_to_travel"):
-        travel = profile.get("willing_to_travel", {})
-        if isinstance(travel, dict):
-            travel_de = travel.get("de", "")
-        else:
-            travel_de = str(travel)
-        if travel_de:
-            lines.append(f"\\textbf{{Bereitschaft zu Reisen:}} {_escape_latex(travel_de)}")
-
-    if profile.get("employment_status"):
-        status = profile.get("employment_status", {})
-        if isinstance(status, dict):
-            status_de = status.get("de", "")
-        else:
-            status_de = str(status)
-        if status_de:
-            lines.append(f"\\textbf{{Beschäftigungsart:}} {_escape_latex(status_de)}")
 
-    return " \\newline ".join(lines) if lines else ""
+def _get_de(data: dict, key: str) -> str:
+    """Get the German text of a field that is either a translation dict or a scalar.
+
+    Args:
+        data: Dictionary containing the field.
+        key: Field name.
+
+    Returns:
+        The ``de`` entry of a dict value, the string form of any other value,
+        or an empty string if the field is missing or empty.
+    """
+    value = data.get(key)
+    if not value:
+        return ""
+    if isinstance(value, dict):
+        return str(value.get("de") or "")
+    return str(value)
 
 
 def _convert_bullets_to_itemize(text: str) -> str:
@@ -386,48 +786,45 @@ def _convert_bullets_to_itemize(text: str) -> str:
     Returns:
         Text with bullet points converted to LaTeX itemize list.
     """
-    lines = text.split("\n")
-    result_parts: list[str] = []
-    bullet_items: list[str] = []
-    current_text: list[str] = []
-    
-    for line in lines:
+    if "- " not in text:
+        # No bullet points: just text lines joined by LaTeX line breaks
+        return _escape_latex(text, preserve_linebreaks=True)
+
+    buf = io.StringIO()
+    write = buf.write
+    escape = _escape_latex_cached  # lines are stripped, so no line-break handling
+    in_list = False  # inside an open itemize environment
+    in_text = False  # inside a block of text lines joined by LaTeX line breaks
+
+    for line in text.split("\n"):
         stripped = line.strip()
         if stripped.startswith("- "):
-            # Found a bullet point
-            if current_text:
-                # Flush accumulated text with LaTeX line breaks preserved
-                text_part = " \\\\ ".join([_escape_latex(t) for t in current_text])
-                result_parts.append(text_part)
-                current_text = []
-            # Collect bullet item
-            bullet_items.append(_escape_latex(stripped[2:].strip()))
+            # Found a bullet point; open a list unless one is running
+            if not in_list:
+                if buf.tell():
+                    write("\n\n")
+                write("\\begin{itemize}\n")
+                in_list = True
+                in_text = False
+            write(f"  \\item {escape(stripped[2:].strip())}\n")
         else:
-            if bullet_items:
-                # Flush accumulated bullets
-                bullet_text = "\\begin{itemize}\n"
-                for item in bullet_items:
-                    bullet_text += f"  \\item {item}\n"
-                bullet_text += "\\end{itemize}"
-                result_parts.append(bullet_text)
-                bullet_items = []
-            # Add regular text
+            if in_list:
+                # Any non-bullet line, even a blank one, closes the list
+                write("\\end{itemize}")
+                in_list = False
+            # Add regular text, keeping line breaks across blank lines
             if stripped:
-                current_text.append(stripped)
-    
-    # Flush any remaining content
-    if bullet_items:
-        bullet_text = "\\begin{itemize}\n"
-        for item in bullet_items:
-            bullet_text += f"  \\item {item}\n"
-        bullet_text += "\\end{itemize}"
-        result_parts.append(bullet_text)
-    elif current_text:
-        # Preserve line breaks in remaining text
-        text_part = " \\\\ ".join([_escape_latex(t) for t in current_text])
-        result_parts.append(text_part)
-    
-    return "\n\n".join(result_parts)
+                if in_text:
+                    write(" \\\\ ")
+                else:
+                    if buf.tell():
+                        write("\n\n")
+                    in_text = True
+                write(escape(stripped))
+
+    if in_list:
+        write("\\end{itemize}")
+    return buf.getvalue()
 
 
 def _escape_latex(text: str, preserve_linebreaks: bool = False) -> str:
@@ -442,38 +839,44 @@ def _escape_latex(text: str, preserve_linebreaks: bool = False) -> str:
     """
     # Preserve linebreaks before escaping if requested
     if preserve_linebreaks:
-        # Split by newlines, escape each line, then rejoin with LaTeX linebreak
-        lines = text.split("\n")
-        escaped_lines = []
-        for line in lines:
-            line = line.strip()  # Remove leading/trailing whitespace from each line
-            if line:  # Only add non-empty lines
-                # Escape special LaTeX characters in the line
-                line = line.replace("\\", "\\textbackslash{}")
-                line = line.replace("{", "\\{")
-                line = line.replace("}", "\\}")
-                line = line.replace("$", "\\$")
-                line = line.replace("&", "\\&")
-                line = line.replace("%", "\\%")
-                line = line.replace("#", "\\#")
-                line = line.replace("_", "\\_")
-                line = line.replace("^", "\\^{}")
-                line = line.replace("~", "\\textasciitilde{}")
-                escaped_lines.append(line)
-        return " \\\\ ".join(escaped_lines)
-    
+        # Escape each non-empty line, then rejoin with LaTeX linebreak
+        return " \\\\ ".join(
+            _escape_latex_cached(line) for line in map(str.strip, text.split("\n")) if line
+        )
+
     # Standard escaping without preserving linebreaks
-    text = text.replace("\\", "\\textbackslash{}")
-    text = text.replace("{", "\\{")
-    text = text.replace("}", "\\}")
-    text = text.replace("$", "\\$")
-    text = text.replace("&", "\\&")
-    text = text.replace("%", "\\%")
-    text = text.replace("#", "\\#")
-    text = text.replace("_", "\\_")
-    text = text.replace("^", "\\^{}")
-    text = text.replace("~", "\\textasciitilde{}")
-    return text
+    return _escape_latex_cached(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_latex_cached(text: str) -> str:
+    """Escape special LaTeX characters, leaving newlines as they are.
+
+    Results are memoized: skill, tool and company names repeat across
+    sections and across CVs loaded in one process.
+
+    Args:
+        text: Text to escape.
+
+    Returns:
+        Escaped text safe for LaTeX.
+    """
+    # Most fields contain no specials; a C-level scan avoids building a copy
+    if _LATEX_SPECIALS_RE.search(text) is None:
+        return text
+    return text.translate(_LATEX_ESCAPES)
+
+
+def _escape_latex_many(texts: Iterable[str]) -> list[str]:
+    """Escape special LaTeX characters in several strings at once.
+
+    Args:
+        texts: Texts to escape.
+
+    Returns:
+        Escaped texts, in input order.
+    """
+    return list(map(_escape_latex_cached, texts))
 
 
 def save_cv_to_yaml(cv: CurriculumVitae, file_path: Path | str) -> None:
@@ -487,7 +890,15 @@ def save_cv_to_yaml(cv: CurriculumVitae, file_path: Path | str) -> None:
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        yaml.dump(cv.model_dump(), f, allow_unicode=True, default_flow_style=False)
+        # Keys keep the model's field order, which also spares PyYAML a sort
+        yaml.dump(
+            cv.model_dump(),
+            f,
+            Dumper=_SafeDumper,
+            allow_unicode=True,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
 def load_anschreiben_from_yaml(file_path: Path | str) -> Anschreiben:
     """Load Anschreiben (cover letter) from YAML file.
@@ -499,47 +910,40 @@ def load_anschreiben_from_yaml(file_path: Path | str) -> Anschreiben:
         Anschreiben model instance.
     """
     file_path = Path(file_path)
-    with open(file_path, encoding="utf-8") as f:
-        data: dict[str, Any] = yaml.safe_load(f)
+    data: dict[str, Any] = _parse_yaml_cached(file_path)
 
     # Parse contact info - try from anschreiben.yaml first, then cv_basis.yaml
     contact_data = data.get("contact", {})
+    sender_address_data = data.get("sender_address", {})
+
+    # Missing contact info or sender address comes from cv_basis.yaml in the same directory
+    persoenliche_daten: dict[str, Any] = {}
+    if not contact_data or not sender_address_data:
+        cv_basis = _load_yaml_file(file_path.parent / "cv_basis.yaml") or {}
+        persoenliche_daten = cv_basis.get("persoenliche_daten", {})
+
+    if not contact_data:
+        # Map German field names to contact info fields
+        if "name" in persoenliche_daten:
+            contact_data["name"] = persoenliche_daten["name"]
+        if "email" in persoenliche_daten:
+            contact_data["email"] = persoenliche_daten["email"]
+        if "telefon" in persoenliche_daten:
+            contact_data["phone"] = persoenliche_daten["telefon"]
     
-    # If contact info is missing, try to load from cv_basis.yaml in the same directory
-    if not contact_data and "name" not in contact_data and "email" not in contact_data:
-        cv_basis_path = file_path.parent / "cv_basis.yaml"
-        if cv_basis_path.exists():
-            cv_basis = _load_yaml_file(cv_basis_path) or {}
-            persoenliche_daten = cv_basis.get("persoenliche_daten", {})
-            
-            # Map German field names to contact info fields
-            if "name" in persoenliche_daten:
-                contact_data["name"] = persoenliche_daten["name"]
-            if "email" in persoenliche_daten:
-                contact_data["email"] = persoenliche_daten["email"]
-            if "telefon" in persoenliche_daten:
-                contact_data["phone"] = persoenliche_daten["telefon"]
-    
-    contact = ContactInfo(**contact_data)
+    contact = ContactInfo.model_validate(contact_data)
 
     # Parse sender address - try from anschreiben.yaml first, then cv_basis.yaml
-    sender_address_data = data.get("sender_address", {})
-    
     if not sender_address_data:
-        cv_basis_path = file_path.parent / "cv_basis.yaml"
-        if cv_basis_path.exists():
-            cv_basis = _load_yaml_file(cv_basis_path) or {}
-            persoenliche_daten = cv_basis.get("persoenliche_daten", {})
-            
-            # Map German field names
-            if "adresse" in persoenliche_daten:
-                sender_address_data["street"] = persoenliche_daten["adresse"]
-            if "plz_ort" in persoenliche_daten:
-                sender_address_data["postal_city"] = persoenliche_daten["plz_ort"]
+        # Map German field names
+        if "adresse" in persoenliche_daten:
+            sender_address_data["street"] = persoenliche_daten["adresse"]
+        if "plz_ort" in persoenliche_daten:
+            sender_address_data["postal_city"] = persoenliche_daten["plz_ort"]
     
     sender_address = None
     if sender_address_data:
-        sender_address = PostalAddress(**sender_address_data)
+        sender_address = PostalAddress.model_validate(sender_address_data)
 
     # Extract all fields
     anschreiben_data = {
@@ -566,7 +970,7 @@ def load_anschreiben_from_yaml(file_path: Path | str) -> Anschreiben:
         "pdf_keywords": data.get("pdf_keywords"),
     }
 
-    return Anschreiben(**anschreiben_data)
+    return Anschreiben.model_validate(anschreiben_data)
 
 
 def load_anschreiben_from_yaml_folder(
@@ -585,17 +989,15 @@ def load_anschreiben_from_yaml_folder(
     folder_path = Path(folder_path)
 
     # Load cv_basis for contact information (primary source for anschreiben)
-    cv_basis = _load_yaml_file(folder_path / "cv_basis.yaml") or {}
+    # and basedata for fallback data, concurrently
+    cv_basis, basedata = _load_yaml_files([folder_path / "cv_basis.yaml", folder_path / "basedata.yaml"])
+    cv_basis = cv_basis or {}
     persoenliche_daten = cv_basis.get("persoenliche_daten", {})
-
-    # Load basedata for fallback data
-    basedata = _load_yaml_file(folder_path / "basedata.yaml") or {}
+    basedata = basedata or {}
     profile_data = basedata.get("profile_data", {})
 
     # Load anschreiben-specific data
-    anschreiben_file_path = folder_path / anschreiben_file
-    with open(anschreiben_file_path, encoding="utf-8") as f:
-        anschreiben_data: dict[str, Any] = yaml.safe_load(f) or {}
+    anschreiben_data: dict[str, Any] = _parse_yaml_cached(folder_path / anschreiben_file) or {}
 
     # Merge contact info from cv_basis (persoenliche_daten) first, then basedata
     contact_data = anschreiben_data.get("contact", {})
@@ -621,7 +1023,7 @@ def load_anschreiben_from_yaml_folder(
     if "phone" not in contact_data and "telefon" in persoenliche_daten:
         contact_data["phone"] = persoenliche_daten["telefon"]
 
-    contact = ContactInfo(**contact_data)
+    contact = ContactInfo.model_validate(contact_data)
 
     # Extract sender address from cv_basis or anschreiben data
     sender_address = anschreiben_data.get("sender_address")
@@ -729,4 +1131,4 @@ def load_anschreiben_from_yaml_folder(
             "company_street, company_postal_code, company_city."
         )
 
-    return Anschreiben(**final_data)
\ No newline at end of file
+    return Anschreiben.model_validate(final_data)
\ No newline at end of file
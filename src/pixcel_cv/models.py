@@ -3,11 +3,14 @@
 from datetime import date
 
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic.json_schema import JsonDict
 
 
 class ContactInfo(BaseModel):
     """Contact information section."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     email: str
     title: str | None = None
@@ -22,6 +25,8 @@ class ContactInfo(BaseModel):
 class PostalAddress(BaseModel):
     """Postal address with street and postal code/city."""
 
+    model_config = ConfigDict(frozen=True)
+
     street: str | None = None
     postal_city: str | None = None
 
@@ -29,17 +34,20 @@ class PostalAddress(BaseModel):
 class DateRange(BaseModel):
     """Date range for work/education periods."""
 
+    model_config = ConfigDict(frozen=True)
+
     start: date
     end: date | None = None
     present: bool = False
 
     def format_de(self) -> str:
         """Format date range in German style (MM/YYYY)."""
-        start_str = self.start.strftime("%m/%Y")
+        # Same output as strftime("%m/%Y") without parsing a format string
+        start_str = f"{self.start.month:02d}/{self.start.year}"
         if self.present:
             return f"{start_str} – heute"
         elif self.end:
-            end_str = self.end.strftime("%m/%Y")
+            end_str = f"{self.end.month:02d}/{self.end.year}"
             return f"{start_str} – {end_str}"
         return start_str
 
@@ -47,6 +55,8 @@ class DateRange(BaseModel):
 class WorkExperience(BaseModel):
     """Work experience entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     company: str
     location: str | None = None
@@ -58,6 +68,8 @@ class WorkExperience(BaseModel):
 class Education(BaseModel):
     """Education entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     degree: str
     institution: str
     field: str | None = None
@@ -70,6 +82,8 @@ class Education(BaseModel):
 class Skill(BaseModel):
     """Skill entry."""
 
+    model_config = ConfigDict(frozen=True)
+
     category: str
     items: list[str]
 
@@ -77,6 +91,8 @@ class Skill(BaseModel):
 class Language(BaseModel):
     """Language proficiency."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str
     level: str  # e.g., "Native", "Fluent", "Professional", "Basic"
 
@@ -84,6 +100,8 @@ class Language(BaseModel):
 class Certification(BaseModel):
     """Certification or achievement."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     issuer: str
     date: date
@@ -91,28 +109,28 @@ class Certification(BaseModel):
     credential_url: str | None = None
 
 
+# Example document shown in the CurriculumVitae JSON schema
+_CV_EXAMPLE: JsonDict = {
+    "contact": {
+        "name": "Max Mustermann",
+        "email": "max@example.de",
+        "phone": "+49 123 456789",
+        "location": "Berlin, Deutschland",
+    },
+    "berufliches_profil": "Erfahrener Data Engineer mit Expertise in Azure...",
+    "work_experience": [],
+    "education": [],
+    "skills": [],
+    "languages": [],
+    "certifications": [],
+    "custom_sections": {},
+}
+
+
 class CurriculumVitae(BaseModel):
     """Complete CV document."""
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "contact": {
-                    "name": "Max Mustermann",
-                    "email": "max@example.de",
-                    "phone": "+49 123 456789",
-                    "location": "Berlin, Deutschland",
-                },
-                "berufliches_profil": "Erfahrener Data Engineer mit Expertise in Azure...",
-                "work_experience": [],
-                "education": [],
-                "skills": [],
-                "languages": [],
-                "certifications": [],
-                "custom_sections": {},
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra={"example": _CV_EXAMPLE})
 
     contact: ContactInfo
     berufliches_profil: str | None = None
@@ -1,19 +1,32 @@
 """Template loading utilities."""
 
+import functools
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
+from ..cache import private_cache_dir
 
-def load_german_cv_template() -> Template:
-    """Load German CV LaTeX template.
+_TEMPLATE_DIR = Path(__file__).parent
+
+
+@functools.lru_cache(maxsize=1)
+def _environment() -> Environment:
+    """Create the shared Jinja2 environment with LaTeX-safe delimiters.
+
+    The environment is built once per process; Jinja caches compiled
+    templates on it. The templates ship with the package, so reloading
+    is disabled and later lookups skip the stat of the source file.
+    Compiled bytecode is also kept on disk so later processes skip
+    parsing the template sources.
 
     Returns:
-        Jinja2 template object.
+        Jinja2 environment object.
     """
-    template_dir = Path(__file__).parent
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
+    return Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        bytecode_cache=_bytecode_cache(),
+        auto_reload=False,
         autoescape=False,
         variable_start_string="<VAR>",
         variable_end_string="</VAR>",
@@ -25,7 +38,32 @@ def load_german_cv_template() -> Template:
         lstrip_blocks=True,
         finalize=lambda x: x if x is not None else "",
     )
-    return env.get_template("german_cv.tex")
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """Create the on-disk bytecode cache for compiled templates.
+
+    Cached bytecode is executed when loaded, so the cache directory must
+    belong to the current user and is kept private to them.
+
+    Returns:
+        Bytecode cache, or None if the cache directory is not writable or not
+        owned by the current user.
+    """
+    directory = private_cache_dir("jinja")
+    if directory is None:
+        return None
+    return FileSystemBytecodeCache(str(directory), "%s.cache")
+
+
+def load_german_cv_template() -> Template:
+    """Load German CV LaTeX template.
+
+    Returns:
+        Jinja2 template object.
+    """
+    return _environment().get_template("german_cv.tex")
+
 
 def load_anschreiben_template() -> Template:
     """Load German Anschreiben (cover letter) LaTeX template.
@@ -33,18 +71,4 @@ def load_anschreiben_template() -> Template:
     Returns:
         Jinja2 template object.
     """
-    template_dir = Path(__file__).parent
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        autoescape=False,
-        variable_start_string="<VAR>",
-        variable_end_string="</VAR>",
-        block_start_string="<BLOCK>",
-        block_end_string="</BLOCK>",
-        comment_start_string="<COMMENT>",
-        comment_end_string="</COMMENT>",
-        trim_blocks=True,
-        lstrip_blocks=True,
-        finalize=lambda x: x if x is not None else "",
-    )
-    return env.get_template("anschreiben.tex")
\ No newline at end of file
+    return _environment().get_template("anschreiben.tex")
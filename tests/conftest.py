@@ -0,0 +1,53 @@
+"""Shared pytest fixtures."""
+
+import shutil
+import tempfile
+
+import pytest
+
+from pixcel_cv import loaders, templates
+from pixcel_cv.models import ContactInfo, CurriculumVitae
+
+_session_env = pytest.MonkeyPatch()
+_session_cache: str | None = None
+
+
+def pytest_configure(config):
+    """Point the cache at a throwaway directory before test modules are imported.
+
+    Script-style modules such as test_onedrive_integration.py load and render
+    CVs at import time, before any fixture runs.
+    """
+    global _session_cache
+    _session_cache = tempfile.mkdtemp(prefix="pixcel_cv-test-cache-")
+    _session_env.setenv("PIXCEL_CV_CACHE_DIR", _session_cache)
+
+
+def pytest_unconfigure(config):
+    """Restore the environment and remove the session cache directory."""
+    _session_env.undo()
+    if _session_cache:
+        shutil.rmtree(_session_cache, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path_factory, monkeypatch):
+    """Give every test its own empty on-disk cache.
+
+    The Jinja environment binds its bytecode cache to the cache dir active
+    when it is first built, and parsed YAML is memoized per process, so
+    both are reset around every test.
+    """
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("PIXCEL_CV_CACHE_DIR", str(path))
+    templates._environment.cache_clear()
+    loaders._parse_yaml.cache_clear()
+    yield path
+    templates._environment.cache_clear()
+    loaders._parse_yaml.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def cv():
+    """Minimal CV shared across tests; tests must not modify it."""
+    return CurriculumVitae(contact=ContactInfo(name="Max Mustermann", email="max@example.de"))
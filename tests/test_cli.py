@@ -18,4 +18,48 @@ def test_cli_missing_input(capsys):
     result = main("nonexistent.yaml")
     assert result == 1
     captured = capsys.readouterr()
-    assert "not found" in captured.err
+    assert "Error: Input file not found: nonexistent.yaml" in captured.err
+    assert "Traceback" not in captured.err
+
+
+def test_cli_batch_rejects_single_document_options(tmp_path, capsys):
+    """Test --batch refuses options that only apply to a single document."""
+    result = main(batch_folder=str(tmp_path), output_latex=str(tmp_path / "cv.tex"))
+
+    assert result == 1
+    assert "Error: Cannot combine --batch with --pdf, --latex or --portrait" in capsys.readouterr().err
+    assert not list(tmp_path.iterdir())
+
+
+def test_cli_exports_latex(tmp_path):
+    """Test CLI LaTeX export from the example YAML folder."""
+    latex_path = tmp_path / "out" / "cv.tex"
+    examples = Path(__file__).parent.parent / "yaml" / "examples"
+
+    result = main(yaml_folder=str(examples), output_latex=str(latex_path))
+
+    assert result == 0
+    latex = latex_path.read_text(encoding="utf-8")
+    assert r"\documentclass" in latex
+    assert "Max Mustermann" in latex
+
+
+def test_cli_exports_anschreiben_latex(tmp_path):
+    """Test CLI Anschreiben LaTeX export from the example YAML folder."""
+    latex_path = tmp_path / "anschreiben.tex"
+    examples = Path(__file__).parent.parent / "yaml" / "examples"
+
+    result = main(yaml_folder=str(examples), output_latex=str(latex_path), is_anschreiben=True)
+
+    assert result == 0
+    assert r"\documentclass" in latex_path.read_text(encoding="utf-8")
+
+
+def test_cli_parsers_built_once():
+    """Test the argument parsers are reused across calls."""
+    from pixcel_cv.cli import _build_flat_parser, _build_subcommand_parser
+
+    assert _build_flat_parser() is _build_flat_parser()
+    assert _build_subcommand_parser() is _build_subcommand_parser()
+    args = _build_subcommand_parser().parse_args(["cv", "--force", "cv.yaml"])
+    assert args.command == "cv" and args.force and args.input == "cv.yaml"
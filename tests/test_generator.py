@@ -1,18 +1,246 @@
 """Test CV generation."""
 
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
 from pixcel_cv.models import CurriculumVitae, ContactInfo
-from pixcel_cv.generator import CVGenerator
+from pixcel_cv.generator import CVGenerator, compile_many_to_pdf, compile_to_pdf
 
 
-def test_generator_to_latex():
+def test_generator_to_latex(cv):
     """Test LaTeX generation from CV model."""
-    cv = CurriculumVitae(
-        contact=ContactInfo(name="Max Mustermann", email="max@example.de")
-    )
-
     generator = CVGenerator(cv)
     latex = generator.to_latex()
 
     assert r"\documentclass" in latex
     assert "Max Mustermann" in latex
     assert "max@example.de" in latex
+
+
+def test_template_loaded_once():
+    """Test repeated loads reuse the compiled template."""
+    from pixcel_cv.templates import load_anschreiben_template, load_german_cv_template
+
+    assert load_german_cv_template() is load_german_cv_template()
+    assert load_anschreiben_template() is load_anschreiben_template()
+
+
+def test_template_bytecode_cached_on_disk(cache_dir):
+    """Test compiled templates are written to the bytecode cache."""
+    from pixcel_cv.templates import load_german_cv_template
+
+    load_german_cv_template()
+
+    assert list((cache_dir / "jinja").glob("*.cache"))
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX file ownership only")
+def test_template_bytecode_cache_kept_private(cache_dir):
+    """Test a group or world writable bytecode cache is restricted to its owner."""
+    from pixcel_cv.templates import load_german_cv_template
+
+    (cache_dir / "jinja").mkdir(mode=0o777)
+    (cache_dir / "jinja").chmod(0o777)
+
+    load_german_cv_template()
+
+    assert (cache_dir / "jinja").stat().st_mode & 0o077 == 0
+
+
+def _fake_engine(log_text, calls):
+    """Build a subprocess.run stand-in that writes a log and a PDF."""
+
+    def run(argv, **kwargs):
+        calls.append(argv)
+        tex_file = Path(argv[-1])
+        tex_file.with_suffix(".log").write_text(log_text)
+        tex_file.with_suffix(".pdf").write_bytes(b"%PDF-1.5")
+
+    return run
+
+
+def test_compile_single_pass_without_rerun(tmp_path, monkeypatch, cv):
+    """Test the engine runs once when the log requests no rerun."""
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_engine("Output written on cv.pdf", calls))
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf")
+
+    assert len(calls) == 1
+    assert (tmp_path / "cv.pdf").read_bytes() == b"%PDF-1.5"
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["cv.pdf", "cv.pixcel-hash"]
+
+
+def test_compile_reruns_on_request(tmp_path, monkeypatch, cv):
+    """Test a second pass runs when LaTeX asks for it."""
+    calls = []
+    log = "LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right."
+    monkeypatch.setattr(subprocess, "run", _fake_engine(log, calls))
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf")
+
+    assert len(calls) == 2
+
+
+def _fake_format_engine(calls, fail_with_format=False):
+    """Build a subprocess.run stand-in that also dumps format files for -ini runs."""
+
+    def run(argv, **kwargs):
+        calls.append((argv, kwargs.get("env")))
+        if "-ini" in argv:
+            jobname = next(arg for arg in argv if arg.startswith("-jobname="))[len("-jobname="):]
+            build_dir = Path(argv[argv.index("-output-directory") + 1])
+            (build_dir / f"{jobname}.fmt").write_bytes(b"format")
+            return
+        if fail_with_format and any(arg.startswith("-fmt=") for arg in argv):
+            raise subprocess.CalledProcessError(1, argv, stderr=b"Fatal format file error")
+        tex_file = Path(argv[-1])
+        tex_file.with_suffix(".log").write_text("")
+        tex_file.with_suffix(".pdf").write_bytes(b"%PDF-1.5")
+
+    return run
+
+
+def test_compile_with_cached_preamble(tmp_path, monkeypatch, cv, cache_dir):
+    """Test the preamble format is loaded via -fmt and rebuilt when the engine changes."""
+    engine_binary = tmp_path / "pdflatex"
+    engine_binary.write_bytes(b"")
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_format_engine(calls))
+    monkeypatch.setattr(shutil, "which", lambda name: str(engine_binary))
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf", precompile_preamble=True)
+
+    (ini_argv, _), (argv, env) = calls
+    fmt_name = next(arg for arg in ini_argv if arg.startswith("-jobname="))[len("-jobname="):]
+    assert f"-fmt={fmt_name}" in argv
+    assert env["TEXFORMATS"] == f"{cache_dir / 'formats'}{os.pathsep}"
+
+    # An upgraded engine binary cannot load the old format
+    engine_binary.write_bytes(b"upgraded")
+    compile_to_pdf(cv, tmp_path / "cv.pdf", precompile_preamble=True, force=True)
+
+    assert len(calls) == 4
+    assert "-ini" in calls[2][0] and f"-jobname={fmt_name}" not in calls[2][0]
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX file ownership only")
+def test_compile_ignores_shared_format_file(tmp_path, monkeypatch, cv, cache_dir):
+    """Test a format file writable by other users is never passed to -fmt."""
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_format_engine(calls))
+    compile_to_pdf(cv, tmp_path / "cv.pdf", precompile_preamble=True)
+    for fmt_file in (cache_dir / "formats").glob("*.fmt"):
+        assert fmt_file.stat().st_mode & 0o022 == 0
+        fmt_file.chmod(0o666)
+    calls.clear()
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf", precompile_preamble=True, force=True)
+
+    (argv, env), = calls
+    assert not any(arg.startswith("-fmt=") for arg in argv)
+    assert env is None
+
+
+def test_compile_falls_back_when_format_fails(tmp_path, monkeypatch, cv, cache_dir):
+    """Test a format that no longer loads is dropped after a plain run succeeds."""
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_format_engine(calls, fail_with_format=True))
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf", precompile_preamble=True)
+
+    assert [any(arg.startswith("-fmt=") for arg in argv) for argv, _ in calls[1:]] == [True, False]
+    assert calls[2][1] is None
+    assert (tmp_path / "cv.pdf").read_bytes() == b"%PDF-1.5"
+    assert not list((cache_dir / "formats").glob("*.fmt"))
+
+
+def test_compile_skips_unchanged_source(tmp_path, monkeypatch, cv):
+    """Test the engine is skipped while the source and PDF are unchanged."""
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_engine("", calls))
+    output_path = tmp_path / "cv.pdf"
+
+    compile_to_pdf(cv, output_path)
+    compile_to_pdf(cv, output_path)
+    assert len(calls) == 1
+
+    compile_to_pdf(cv, output_path, force=True)
+    assert len(calls) == 2
+
+    changed = CurriculumVitae(contact=ContactInfo(name="Erika Musterfrau", email="max@example.de"))
+    compile_to_pdf(changed, output_path)
+    assert len(calls) == 3
+
+    output_path.unlink()
+    compile_to_pdf(changed, output_path)
+    assert len(calls) == 4
+
+
+def test_compile_many_writes_one_pdf_per_cv(tmp_path, monkeypatch):
+    """Test batch compilation produces a PDF per named CV."""
+    calls = []
+    monkeypatch.setattr(subprocess, "run", _fake_engine("", calls))
+    cvs = {
+        name: CurriculumVitae(contact=ContactInfo(name=name, email=f"{name}@example.de"))
+        for name in ("alpha", "beta")
+    }
+
+    outputs = compile_many_to_pdf(cvs, tmp_path, max_workers=2)
+
+    assert outputs == {"alpha": tmp_path / "alpha.pdf", "beta": tmp_path / "beta.pdf"}
+    assert all(path.exists() for path in outputs.values())
+    assert len(calls) == 2
+
+
+def test_compile_failure_reports_log_tail(tmp_path, monkeypatch, cv):
+    """Test engine errors are surfaced from the log when stderr is empty."""
+
+    def run(argv, **kwargs):
+        Path(argv[-1]).with_suffix(".log").write_text("! Undefined control sequence.\nl.42 \\foo")
+        raise subprocess.CalledProcessError(1, argv, stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", run)
+
+    with pytest.raises(RuntimeError, match="Undefined control sequence"):
+        compile_to_pdf(cv, tmp_path / "cv.pdf")
+
+
+def test_compile_writes_rendered_source(tmp_path, monkeypatch):
+    """Test the streamed .tex file matches the rendered LaTeX."""
+    sources = []
+
+    def run(argv, **kwargs):
+        tex_file = Path(argv[-1])
+        sources.append(tex_file.read_text(encoding="utf-8"))
+        tex_file.with_suffix(".log").write_text("")
+        tex_file.with_suffix(".pdf").write_bytes(b"%PDF-1.5")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    cv = CurriculumVitae(contact=ContactInfo(name="Jörg Müller", email="joerg@example.de"))
+
+    compile_to_pdf(cv, tmp_path / "cv.pdf")
+
+    assert sources == [CVGenerator(cv).to_latex()]
+
+
+def test_generator_renders_once(tmp_path, monkeypatch, cv):
+    """Test to_pdf reuses LaTeX already produced by to_latex."""
+    from pixcel_cv import generator as generator_module
+
+    monkeypatch.setattr(subprocess, "run", _fake_engine("", []))
+    generator = CVGenerator(cv)
+    latex = generator.to_latex()
+
+    def fail(*args):
+        raise AssertionError("CV was rendered twice")
+
+    monkeypatch.setattr(generator_module, "render_cv", fail)
+    monkeypatch.setattr(generator_module, "_render_to", fail)
+
+    assert generator.to_latex() is latex
+    generator.to_pdf(tmp_path / "cv.pdf")
@@ -0,0 +1,295 @@
+"""Test YAML loading."""
+
+import os
+import pickle
+import shutil
+from pathlib import Path
+
+import pytest
+
+from pixcel_cv import loaders
+from pixcel_cv.loaders import (
+    _build_availability_section,
+    _convert_bullets_to_itemize,
+    _escape_latex,
+    _format_project,
+    _format_station,
+    _load_yaml_file,
+    _load_yaml_files,
+    load_anschreiben_from_yaml,
+    load_cv_from_yaml,
+    load_cv_from_yaml_folder,
+    save_cv_to_yaml,
+)
+
+EXAMPLES_PATH = Path(__file__).parent.parent / "yaml" / "examples"
+
+
+def test_load_cv_from_example_folder():
+    """Test the multi-file loader on the shipped example data."""
+    cv = load_cv_from_yaml_folder(EXAMPLES_PATH)
+
+    assert cv.contact.name == "Max Mustermann"
+    assert "Beruflicher Werdegang" in cv.custom_sections
+    assert "Cloud Migration Platform" in cv.projects
+
+
+def test_load_yaml_file_missing(tmp_path):
+    """Test missing optional YAML files load as None."""
+    assert _load_yaml_file(tmp_path / "missing.yaml") is None
+
+
+def test_load_yaml_files_lists_each_folder(tmp_path):
+    """Test present, missing and missing-folder files load in order."""
+    (tmp_path / "skills.yaml").write_text("skills: [Python]\n", encoding="utf-8")
+
+    assert _load_yaml_files(
+        [tmp_path / "skills.yaml", tmp_path / "missing.yaml", tmp_path / "nope" / "cv.yaml"]
+    ) == [{"skills": ["Python"]}, None, None]
+
+
+def test_load_yaml_files_matches_listing_case_insensitively(tmp_path, monkeypatch):
+    """Test a name differing only in case is left to the filesystem to resolve."""
+    (tmp_path / "CV_Basis.yaml").write_text("persoenliche_daten: {}\n", encoding="utf-8")
+    opened = []
+
+    def parse(file_path):
+        # Stand-in for a case-insensitive filesystem such as APFS or NTFS
+        opened.append(file_path.name)
+        return {"persoenliche_daten": {}}
+
+    monkeypatch.setattr(loaders, "_parse_yaml_cached", parse)
+
+    assert _load_yaml_files([tmp_path / "cv_basis.yaml", tmp_path / "skills.yaml"]) == [
+        {"persoenliche_daten": {}},
+        None,
+    ]
+    assert opened == ["cv_basis.yaml"]
+
+
+def test_load_yaml_file_picks_up_changes(tmp_path):
+    """Test cached YAML is re-parsed once the file changes."""
+    yaml_file = tmp_path / "skills.yaml"
+    yaml_file.write_text("skills: [Python]\n", encoding="utf-8")
+    assert _load_yaml_file(yaml_file) == {"skills": ["Python"]}
+
+    yaml_file.write_text("skills: [Python, Rust]\n", encoding="utf-8")
+    stat = yaml_file.stat()
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert _load_yaml_file(yaml_file) == {"skills": ["Python", "Rust"]}
+
+
+def test_load_yaml_file_returns_private_copy(tmp_path):
+    """Test callers mutating loaded data don't affect later loads."""
+    yaml_file = tmp_path / "cv_basis.yaml"
+    yaml_file.write_text("persoenliche_daten:\n  name: Max\n", encoding="utf-8")
+
+    first = _load_yaml_file(yaml_file)
+    first["persoenliche_daten"]["name"] = "Changed"
+
+    assert _load_yaml_file(yaml_file) == {"persoenliche_daten": {"name": "Max"}}
+
+
+def test_load_cv_from_folder_uses_json_cache(tmp_path, monkeypatch):
+    """Test unchanged folders are served from the merged-CV cache."""
+    data_folder = tmp_path / "data"
+    shutil.copytree(EXAMPLES_PATH, data_folder)
+    first = load_cv_from_yaml_folder(data_folder)
+
+    def fail(*args):
+        raise AssertionError("CV was rebuilt from YAML")
+
+    monkeypatch.setattr(loaders, "_build_cv_from_yaml_folder", fail)
+    assert load_cv_from_yaml_folder(data_folder) == first
+
+
+def test_load_cv_from_folder_rebuilds_after_edit(tmp_path):
+    """Test editing a YAML file invalidates the merged-CV cache."""
+    data_folder = tmp_path / "data"
+    shutil.copytree(EXAMPLES_PATH, data_folder)
+    load_cv_from_yaml_folder(data_folder)
+
+    cv_basis = data_folder / "cv_basis.yaml"
+    cv_basis.write_text(
+        cv_basis.read_text(encoding="utf-8").replace("Max Mustermann", "Erika Musterfrau"),
+        encoding="utf-8",
+    )
+
+    assert load_cv_from_yaml_folder(data_folder).contact.name == "Erika Musterfrau"
+
+
+def test_save_cv_to_yaml_round_trip(tmp_path):
+    """Test a saved CV loads back unchanged."""
+    cv = load_cv_from_yaml_folder(EXAMPLES_PATH)
+    yaml_file = tmp_path / "cv.yaml"
+
+    save_cv_to_yaml(cv, yaml_file)
+
+    assert load_cv_from_yaml(yaml_file) == cv
+
+
+def test_load_yaml_file_uses_disk_cache(tmp_path, monkeypatch):
+    """Test a fresh process reads unchanged YAML from its cached copy."""
+    yaml_file = tmp_path / "certifications.yaml"
+    yaml_file.write_text("certifications:\n  - date: 2024-01-15\n", encoding="utf-8")
+    expected = _load_yaml_file(yaml_file)
+    loaders._parse_yaml.cache_clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML was parsed again")
+
+    monkeypatch.setattr(loaders.yaml, "load", fail)
+    assert _load_yaml_file(yaml_file) == expected
+
+
+def test_load_yaml_file_ignores_corrupt_disk_cache(tmp_path, cache_dir):
+    """Test an unreadable cache file falls back to parsing the YAML."""
+    yaml_file = tmp_path / "skills.yaml"
+    yaml_file.write_text("skills: [Python]\n", encoding="utf-8")
+    _load_yaml_file(yaml_file)
+    loaders._parse_yaml.cache_clear()
+    for cache_file in (cache_dir / "yaml").glob("*.pkl"):
+        cache_file.write_bytes(b"not a pickle")
+
+    assert _load_yaml_file(yaml_file) == {"skills": ["Python"]}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX file ownership only")
+def test_load_yaml_file_ignores_shared_disk_cache(tmp_path, cache_dir):
+    """Test cache files writable by other users are never unpickled."""
+    yaml_file = tmp_path / "skills.yaml"
+    yaml_file.write_text("skills: [Python]\n", encoding="utf-8")
+    _load_yaml_file(yaml_file)
+    loaders._parse_yaml.cache_clear()
+    stat = yaml_file.stat()
+    for cache_file in (cache_dir / "yaml").glob("*.pkl"):
+        assert cache_file.stat().st_mode & 0o077 == 0
+        cache_file.write_bytes(pickle.dumps((stat.st_mtime_ns, stat.st_size, {"skills": []})))
+        cache_file.chmod(0o666)
+
+    assert _load_yaml_file(yaml_file) == {"skills": ["Python"]}
+
+
+def test_escape_latex_special_characters():
+    """Test every LaTeX special character is escaped exactly once."""
+    assert _escape_latex(r"50% & $5 #1 a_b {x} ^ ~") == (
+        r"50\% \& \$5 \#1 a\_b \{x\} \^{} \textasciitilde{}"
+    )
+    assert _escape_latex("C:\\temp") == r"C:\textbackslash{}temp"
+
+
+def test_escape_latex_preserves_linebreaks():
+    """Test non-empty lines are stripped, escaped and joined with LaTeX breaks."""
+    text = "  Zeile 1 & mehr \n\n Zeile_2  \n"
+
+    assert _escape_latex(text, preserve_linebreaks=True) == r"Zeile 1 \& mehr \\ Zeile\_2"
+
+
+def test_format_station():
+    """Test a station is rendered as a bold heading with escaped task list."""
+    station = {
+        "position": "Entwickler",
+        "unternehmen": "Muster & Co",
+        "ort": "Berlin",
+        "start": "01/2020",
+        "bis": "heute",
+        "aufgaben": ["CI_CD"],
+    }
+
+    assert _format_station(station) == (
+        "\\textbf{Entwickler} \\\\\n"
+        "Muster \\& Co, Berlin (01/2020 -- heute)\n\n"
+        "\\textit{Aufgaben:}\n"
+        "\\begin{itemize}\n"
+        "  \\item CI\\_CD\n"
+        "\\end{itemize}\n"
+        "\n"
+    )
+
+
+def test_format_project_without_title():
+    """Test projects without a German title are left out."""
+    assert _format_project({"description_de": "Beschreibung"}) == ""
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("", ""),
+        ("Nur Text & mehr", "Nur Text \\& mehr"),
+        ("Zeile 1\n\n  Zeile 2  ", "Zeile 1 \\\\ Zeile 2"),
+        ("- a_b\n- c", "\\begin{itemize}\n  \\item a\\_b\n  \\item c\n\\end{itemize}"),
+        (
+            "Intro:\n- a\n- b\nFazit",
+            "Intro:\n\n\\begin{itemize}\n  \\item a\n  \\item b\n\\end{itemize}\n\nFazit",
+        ),
+        (
+            "- a\n\n- b",
+            "\\begin{itemize}\n  \\item a\n\\end{itemize}\n\n\\begin{itemize}\n  \\item b\n\\end{itemize}",
+        ),
+    ],
+)
+def test_convert_bullets_to_itemize(text, expected):
+    """Test bullet lines become itemize lists between line-broken text blocks."""
+    assert _convert_bullets_to_itemize(text) == expected
+
+
+def test_load_cv_from_folder_skips_invalid_certifications(tmp_path):
+    """Test malformed certification entries are dropped, valid ones kept."""
+    (tmp_path / "cv_basis.yaml").write_text(
+        "persoenliche_daten:\n  name: Max\n  email: max@example.de\n", encoding="utf-8"
+    )
+    (tmp_path / "certifications.yaml").write_text(
+        "certifications:\n"
+        "  - {title: AWS, issuer: Amazon, date: '2024-01-15'}\n"
+        "  - {title: Kurz, issuer: Azure, date: 2024-1-5}\n"
+        "  - {title: Falsch, issuer: X, date: '15.01.2024'}\n"
+        "  - {title: Unmöglich, issuer: X, date: '2024-02-30'}\n"
+        "  - {title: Ohne Aussteller, issuer: null, date: '2024-01-15'}\n"
+        "  - kein Eintrag\n",
+        encoding="utf-8",
+    )
+
+    cv = load_cv_from_yaml_folder(tmp_path)
+
+    assert [(c.title, c.date.isoformat()) for c in cv.certifications] == [
+        ("AWS", "2024-01-15"),
+        ("Kurz", "2024-01-05"),
+    ]
+
+
+def test_build_availability_section():
+    """Test availability fields accept translation dicts and plain values."""
+    profile = {
+        "available_from": {"de": "sofort", "en": "immediately"},
+        "willing_to_travel": "50 %",
+        "employment_status": {"en": "freelance"},
+    }
+
+    assert _build_availability_section(profile) == (
+        "\\textbf{Verfügbar ab:} sofort \\newline \\textbf{Bereitschaft zu Reisen:} 50 \\%"
+    )
+
+
+def test_load_yaml_file_large(tmp_path, monkeypatch):
+    """Test files above the memory-map threshold parse like small ones."""
+    monkeypatch.setattr(loaders, "_MMAP_THRESHOLD", 16)
+    yaml_file = tmp_path / "projekt_historie.yaml"
+    yaml_file.write_text("projects:\n  - project_de: Größeres Projekt\n", encoding="utf-8")
+
+    assert _load_yaml_file(yaml_file) == {"projects": [{"project_de": "Größeres Projekt"}]}
+
+
+def test_load_anschreiben_falls_back_to_cv_basis(tmp_path):
+    """Test missing contact and sender address are taken from cv_basis.yaml."""
+    shutil.copy(EXAMPLES_PATH / "cv_basis.yaml", tmp_path)
+    (tmp_path / "anschreiben.yaml").write_text(
+        "company_name: Example Company GmbH\nposition: Entwickler\n", encoding="utf-8"
+    )
+
+    anschreiben = load_anschreiben_from_yaml(tmp_path / "anschreiben.yaml")
+
+    assert anschreiben.contact.name == "Max Mustermann"
+    assert anschreiben.contact.phone == "+49 123 456789"
+    assert anschreiben.sender_address.street == "Beispielstraße 42"
+    assert anschreiben.sender_address.postal_city == "12345 Musterstadt"
@@ -3,6 +3,7 @@
 from datetime import date
 
 import pytest
+from pydantic import ValidationError
 
 from pixcel_cv.models import CurriculumVitae, DateRange, ContactInfo, WorkExperience
 
@@ -22,6 +23,14 @@ def test_date_range_format_de():
     assert dr.format_de() == "03/2020"
 
 
+def test_date_range_validates_direct_construction():
+    """Test DateRange coerces ISO strings and rejects invalid dates."""
+    assert DateRange(start="2020-03-01").format_de() == "03/2020"
+
+    with pytest.raises(ValidationError):
+        DateRange(start="März 2020")
+
+
 def test_cv_model_creation():
     """Test CV model validation."""
     cv_data = {
@@ -68,3 +77,16 @@ def test_cv_model_with_work_experience():
     assert len(cv.work_experience) == 1
     assert cv.work_experience[0].title == "Senior Engineer"
     assert cv.work_experience[0].period.present is True
+
+
+def test_leaf_models_are_frozen():
+    """Test leaf models reject assignment after construction."""
+    contact = ContactInfo(name="Max Mustermann", email="max@example.de")
+
+    with pytest.raises(ValidationError):
+        contact.name = "Erika Musterfrau"
+
+    dr = DateRange(start=date(2020, 3, 15))
+
+    with pytest.raises(ValidationError):
+        dr.present = True
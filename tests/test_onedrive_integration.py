@@ -2,7 +2,7 @@
 """Test OneDrive integration and project filtering logic."""
 
 from pathlib import Path
-from pixcel_cv.loaders import load_cv_from_yaml_folder
+from pixcel_cv.loaders import _parse_yaml_cached, load_cv_from_yaml_folder
 
 # Path to OneDrive YAML files
 ONEDRIVE_YAML_PATH = Path("/Users/maxmustermann/yaml")
@@ -32,9 +32,10 @@ try:
     print(f"Custom sections found: {list(cv.custom_sections.keys())}")
     
     for section_name, content in cv.custom_sections.items():
-        lines = content.split('\n')
-        print(f"\n  {section_name}: {len(lines)} lines")
-        print(f"    Preview: {lines[0][:60]}...")
+        line_count = content.count('\n') + 1
+        first_line = content.partition('\n')[0]
+        print(f"\n  {section_name}: {line_count} lines")
+        print(f"    Preview: {first_line[:60]}...")
 except Exception as e:
     print(f"✗ Error checking sections: {e}")
     import traceback
@@ -46,13 +47,13 @@ print("=" * 80)
 
 try:
     # Load the raw projects
-    import yaml
-    with open(ONEDRIVE_YAML_PATH / "projekt_historie.yaml", "r") as f:
-        projects_raw = yaml.safe_load(f)
+    projects_raw = _parse_yaml_cached(ONEDRIVE_YAML_PATH / "projekt_historie.yaml")
     
-    total_projects = len(projects_raw.get("projects", []))
-    included_projects = [p for p in projects_raw.get("projects", []) if p.get("include_in_cv", False)]
-    excluded_projects = [p for p in projects_raw.get("projects", []) if not p.get("include_in_cv", False)]
+    all_projects = projects_raw.get("projects", [])
+    total_projects = len(all_projects)
+    included_projects, excluded_projects = [], []
+    for p in all_projects:
+        (included_projects if p.get("include_in_cv", False) else excluded_projects).append(p)
     
     print(f"  Total projects in YAML: {total_projects}")
     print(f"  Projects with include_in_cv: true: {len(included_projects)}")
@@ -73,10 +74,11 @@ try:
             print(f"    ... and {len(excluded_projects) - 5} more")
     
     # Check if projects appear in CV custom sections
-    if "Referenzprojekte" in cv.custom_sections:
+    projects_section = cv.custom_sections.get("Referenzprojekte")
+    if projects_section is not None:
         print(f"\n  ✓ Projects section found in CV")
-        lines = cv.custom_sections["Referenzprojekte"].split('\n')
-        print(f"    Content length: {len(lines)} lines")
+        line_count = projects_section.count('\n') + 1
+        print(f"    Content length: {line_count} lines")
     else:
         print(f"\n  ℹ No projects section (all may be filtered out)")
     
@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 """Test project filtering logic with include_in_cv flag."""
 
-import yaml
+import re
 from pathlib import Path
-from pixcel_cv.loaders import load_cv_from_yaml_folder
+from pixcel_cv.loaders import _escape_latex, _parse_yaml_cached, load_cv_from_yaml_folder
 
 ONEDRIVE_YAML_PATH = Path("/Users/maxmustermann/yaml")
 LOCAL_CONFIG_PATH = Path("yaml")
+PROJECT_HEADING_RE = re.compile(r"^\\textbf\{(.*)\} \(", re.MULTILINE)
 
 def test_project_filtering():
     """Test that projects are correctly filtered by include_in_cv flag."""
@@ -16,12 +17,12 @@ def test_project_filtering():
     print("=" * 80)
     
     # Load raw YAML
-    with open(ONEDRIVE_YAML_PATH / "projekt_historie.yaml", "r") as f:
-        projects_raw = yaml.safe_load(f)
+    projects_raw = _parse_yaml_cached(ONEDRIVE_YAML_PATH / "projekt_historie.yaml")
     
     all_projects = projects_raw.get("projects", [])
-    included = [p for p in all_projects if p.get("include_in_cv", False)]
-    excluded = [p for p in all_projects if not p.get("include_in_cv", False)]
+    included, excluded = [], []
+    for p in all_projects:
+        (included if p.get("include_in_cv", False) else excluded).append(p)
     
     # Load through our loader
     cv = load_cv_from_yaml_folder(ONEDRIVE_YAML_PATH, config_folder=LOCAL_CONFIG_PATH)
@@ -32,17 +33,20 @@ def test_project_filtering():
     print(f"   include_in_cv: false/missing: {len(excluded)}")
     
     # Check if projects appear in CV
-    if "Referenzprojekte" in cv.custom_sections:
-        cv_projects_text = cv.custom_sections["Referenzprojekte"]
+    cv_projects_text = cv.custom_sections.get("Referenzprojekte")
+    if cv_projects_text is not None:
         print(f"\n2. CV Custom Section Check:")
         print(f"   ✓ 'Referenzprojekte' section exists")
         print(f"   Content preview: {cv_projects_text[:100]}...")
         
+        # Collect the escaped titles from the "\textbf{<title>} (<from> -- <to>)" headings once
+        cv_titles = set(PROJECT_HEADING_RE.findall(cv_projects_text))
+
         # Verify that included projects are in the CV
         missing_projects = []
         for proj in included:
             proj_de = proj.get("project_de", "")
-            if proj_de and proj_de not in cv_projects_text:
+            if proj_de and _escape_latex(proj_de) not in cv_titles:
                 missing_projects.append(proj_de)
         
         if missing_projects:
@@ -56,7 +60,7 @@ def test_project_filtering():
         found_excluded = []
         for proj in excluded[:10]:  # Check first 10 excluded
             proj_de = proj.get("project_de", "")
-            if proj_de and proj_de in cv_projects_text:
+            if proj_de and _escape_latex(proj_de) in cv_titles:
                 found_excluded.append(proj_de)
         
         if found_excluded: